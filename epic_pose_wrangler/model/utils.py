@@ -0,0 +1,48 @@
+#  Copyright Epic Games, Inc. All Rights Reserved.
+import contextlib
+
+from maya import cmds
+
+# Number of active suspend_refresh contexts, used so that nested contexts only resume refreshing on the outermost exit
+_REFRESH_SUSPEND_DEPTH = 0
+
+
+@contextlib.contextmanager
+def suspend_refresh():
+    """
+    Context manager that suspends viewport refreshes for the duration of the context. Can be safely nested
+
+    >>> with suspend_refresh():
+    >>>     cmds.delete(meshes)
+    """
+    global _REFRESH_SUSPEND_DEPTH
+    if not _REFRESH_SUSPEND_DEPTH:
+        cmds.refresh(suspend=True)
+    _REFRESH_SUSPEND_DEPTH += 1
+    try:
+        yield
+    finally:
+        _REFRESH_SUSPEND_DEPTH -= 1
+        if not _REFRESH_SUSPEND_DEPTH:
+            cmds.refresh(suspend=False)
+
+
+@contextlib.contextmanager
+def suspend_evaluation():
+    """
+    Context manager that switches the evaluation manager to DG mode for the duration of the context so that a batch
+    of edits doesn't rebuild the parallel evaluation graph after each one. Can be safely nested
+
+    >>> with suspend_evaluation():
+    >>>     cmds.setAttr('node.weights[0:2]', 0, 0.5, 1)
+    """
+    evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+    # Already in DG mode, either by preference or from an outer context
+    if evaluation_mode == 'off':
+        yield
+        return
+    cmds.evaluationManager(mode='off')
+    try:
+        yield
+    finally:
+        cmds.evaluationManager(mode=evaluation_mode)
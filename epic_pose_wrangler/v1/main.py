@@ -1,7 +1,7 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
 from epic_pose_wrangler.model.api import RBFAPI
 
-from epic_pose_wrangler.v1 import poseWranglerUI, poseWrangler
+from epic_pose_wrangler.v1 import poseWrangler
 
 
 class UE4RBFAPI(RBFAPI):
@@ -9,7 +9,10 @@ class UE4RBFAPI(RBFAPI):
 
     def __init__(self, view=False, parent=None, file_path=None):
         super(UE4RBFAPI, self).__init__(view=view, parent=parent)
+        # If view is requested, import and build the UI. We use a local import so that any QtWidget dependencies
+        # won't be loaded if the user is running from mayapy
         if view:
+            from epic_pose_wrangler.v1 import poseWranglerUI
             self._view = poseWranglerUI.PoseWrangler()
             self._view.event_upgrade_dispatch.upgrade.connect(self._upgrade)
             self._view.show(dockable=True)
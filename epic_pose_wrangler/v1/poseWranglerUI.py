@@ -4,6 +4,8 @@ from PySide2 import QtWidgets
 from PySide2 import QtCore
 from PySide2 import QtUiTools
 
+import bisect
+import contextlib
 import os
 
 import maya.cmds as cmds
@@ -11,9 +13,103 @@ import maya.OpenMaya as OpenMaya
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 
 from epic_pose_wrangler.log import LOG
-from epic_pose_wrangler.view import log_widget
+from epic_pose_wrangler.model import utils as model_utils
+from epic_pose_wrangler.view import log_widget, utils
 from epic_pose_wrangler.v1 import poseWrangler, upgrade
-from epic_pose_wrangler.v1 import palette
+
+# Cache of (ui file path, modified time): ui file contents so reopening the window doesn't read the file from disk
+_UI_CACHE = {}
+# Palette stylesheet, built on first use. The palette never changes so it is shared between all windows
+_STYLESHEET = None
+
+
+def _load_ui(file_path):
+    """
+    Load the specified UI file, reading its contents from the cache if the file hasn't changed
+    :param file_path :type str: path to the .ui file
+    :return :type QtWidgets.QWidget: loaded widget
+    """
+    if not os.path.exists(file_path):
+        raise ValueError('UI File does not exist on disk at path: {}'.format(file_path))
+    key = (file_path, os.path.getmtime(file_path))
+    ui_data = _UI_CACHE.get(key)
+    if ui_data is None:
+        ui_file = QtCore.QFile(file_path)
+        try:
+            ui_file.open(QtCore.QFile.ReadOnly)
+            ui_data = ui_file.readAll()
+        finally:
+            # Always close the UI file regardless of read result
+            ui_file.close()
+        # Drop any stale entries for this file before caching the new contents
+        for cached_key in [cached_key for cached_key in _UI_CACHE if cached_key[0] == file_path]:
+            del _UI_CACHE[cached_key]
+        _UI_CACHE[key] = ui_data
+    # QUiLoader always builds a new widget, so load it from an in memory buffer over the cached contents
+    ui_buffer = QtCore.QBuffer()
+    ui_buffer.setData(ui_data)
+    try:
+        ui_buffer.open(QtCore.QIODevice.ReadOnly)
+        loader = QtUiTools.QUiLoader()
+        return loader.load(ui_buffer)
+    finally:
+        ui_buffer.close()
+
+
+def _batch_fill(list_widget, items_with_data):
+    """
+    Add items to the list widget with painting and signals suspended so the list only updates once
+    :param list_widget :type QtWidgets.QListWidget: list to add the items to
+    :param items_with_data :type list: list of (text, data) tuples, data is stored on the item's UserRole
+    :return :type list: list of QtWidgets.QListWidgetItem that were added
+    """
+    items = []
+    # Store the lookups used in the loop
+    list_item = QtWidgets.QListWidgetItem
+    role = QtCore.Qt.UserRole
+    add_item = list_widget.addItem
+    append_item = items.append
+    list_widget.setUpdatesEnabled(False)
+    try:
+        with utils.signals_blocked(list_widget):
+            for text, data in items_with_data:
+                item = list_item(text)
+                item.setData(role, data)
+                add_item(item)
+                append_item(item)
+    finally:
+        list_widget.setUpdatesEnabled(True)
+    return items
+
+
+def _replace_selection(nodes):
+    """
+    Replace the scene selection with the specified nodes in a single select call
+    :param nodes :type list: list of node names to select, the selection is cleared if empty
+    """
+    if nodes:
+        cmds.select(nodes, replace=True)
+    else:
+        cmds.select(clear=True)
+
+
+@contextlib.contextmanager
+def _suspend_updates(widget):
+    """
+    Context manager that suspends painting of the widget as well as viewport refreshes and parallel evaluation for
+    the duration of a batch operation
+
+    >>> with _suspend_updates(self):
+    >>>     poseWrangler.import_drivers(path)
+    >>>     self.load_drivers()
+    :param widget :type QtWidgets.QWidget: widget to suspend painting for
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        with model_utils.suspend_refresh(), model_utils.suspend_evaluation():
+            yield
+    finally:
+        widget.setUpdatesEnabled(True)
 
 
 class EventUpgrade(QtCore.QObject):
@@ -65,27 +161,30 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             raise RuntimeError("Unable to load valid RBF plugin version")
 
         # Load the UI file
-        file_path = os.path.dirname(__file__) + "/poseWranglerUI.ui"
-        if os.path.exists(file_path):
-            ui_file = QtCore.QFile(file_path)
-            # Attempt to open and load the UI
-            try:
-                ui_file.open(QtCore.QFile.ReadOnly)
-                loader = QtUiTools.QUiLoader()
-                self.win = loader.load(ui_file)
-            finally:
-                # Always close the UI file regardless of loader result
-                ui_file.close()
-        else:
-            raise ValueError('UI File does not exist on disk at path: {}'.format(file_path))
+        self.win = _load_ui(os.path.dirname(__file__) + "/poseWranglerUI.ui")
 
         self.setWindowTitle("Pose Wrangler")
         # Embed the UI window inside this widget
         self.setCentralWidget(self.win)
 
+        # Set when the poses were reloaded while the pose list was hidden, the list is filled when it is next shown
+        self._poses_dirty = False
+        self.win.pose_LIST.installEventFilter(self)
+
+        # Selected solvers and poses, cached whenever the selection changes so handlers don't have to query the lists.
+        # These are connected first so that the caches are up to date before the other selection changed slots run
+        self._selected_solvers = []
+        self._selected_poses = []
+        self.win.driver_LIST.itemSelectionChanged.connect(self._update_selected_solvers)
+        self.win.pose_LIST.itemSelectionChanged.connect(self._update_selected_poses)
+
         # buttons
         self.win.add_pose_BTN.pressed.connect(self.add_pose)
 
+        # Map of solver node name: UE4PoseDriver, kept between refreshes of the driver list
+        self._solver_cache = {}
+        # Map of solver node name: enabled state the driver list item text was last set for
+        self._last_enabled_state = {}
         # refresh the driver cmd list
         self.load_drivers()
 
@@ -99,6 +198,7 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         self.win.driver_LIST.itemSelectionChanged.connect(self.driver_changed)
         self.win.driver_LIST.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.win.driver_LIST.customContextMenuRequested.connect(self.driver_popup)
+        self._build_driver_popup_menu()
 
         self.win.driven_transforms_LIST.itemSelectionChanged.connect(self.driven_changed)
 
@@ -132,23 +232,23 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
 
     def set_stylesheet(self):
         """set the theming and styling here"""
-        self.setStyleSheet(palette.getPaletteString())
+        global _STYLESHEET
+        if _STYLESHEET is None:
+            # The palette is only needed to build the stylesheet once, so it is imported here
+            from epic_pose_wrangler.v1 import palette
+            _STYLESHEET = palette.getPaletteString()
+        self.setStyleSheet(_STYLESHEET)
 
-    def driver_popup(self, point):
-        """add  right click menu"""
-
-        selected_solvers = self.get_selected_solvers()
-        solver = None
-        if selected_solvers:
-            solver = selected_solvers[-1]
+    def _build_driver_popup_menu(self):
+        """build the right click menu once, driver_popup only toggles which entries are visible"""
 
         """--------------------------EDIT----------------------------"""
 
-        edit_action = QtWidgets.QAction("Edit", self)
-        edit_action.triggered.connect(self.edit_driver)
+        self._edit_action = QtWidgets.QAction("Edit", self)
+        self._edit_action.triggered.connect(self.edit_driver)
 
-        enable_action = QtWidgets.QAction("Finish Editing (Enable)", self)
-        enable_action.triggered.connect(self.enable_driver)
+        self._enable_action = QtWidgets.QAction("Finish Editing (Enable)", self)
+        self._enable_action.triggered.connect(self.enable_driver)
 
         """--------------------------SELECTION----------------------------"""
 
@@ -168,14 +268,14 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
 
         """----------------------IMPORT/EXPORT----------------------------"""
 
-        export_driver_action = QtWidgets.QAction("Export Selected Drivers", self)
-        export_driver_action.triggered.connect(self.export_driver)
+        self._export_driver_action = QtWidgets.QAction("Export Selected Drivers", self)
+        self._export_driver_action.triggered.connect(self.export_driver)
 
         import_driver_action = QtWidgets.QAction("Import Driver(s)", self)
         import_driver_action.triggered.connect(self.import_drivers)
 
-        export_all_action = QtWidgets.QAction("Export All Drivers", self)
-        export_all_action.triggered.connect(self.export_all)
+        self._export_all_action = QtWidgets.QAction("Export All Drivers", self)
+        self._export_all_action.triggered.connect(self.export_all)
 
         """--------------------------ADD----------------------------"""
 
@@ -187,68 +287,79 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         zero_base_pose_action = QtWidgets.QAction("Zero Base Pose Transforms", self)
         zero_base_pose_action.triggered.connect(self.zero_base_poses)
 
-        menu = QtWidgets.QMenu("Options:", self.win.driver_LIST)
+        self._driver_menu = QtWidgets.QMenu("Options:", self.win.driver_LIST)
 
-        select_menu = QtWidgets.QMenu("Select:", menu)
+        select_menu = QtWidgets.QMenu("Select:", self._driver_menu)
         select_menu.addAction(select_driver_action)
         select_menu.addAction(select_driven_action)
         select_menu.addAction(select_solver_action)
 
-        mirror_menu = QtWidgets.QMenu("Mirror:", menu)
+        mirror_menu = QtWidgets.QMenu("Mirror:", self._driver_menu)
         mirror_menu.addAction(mirror_driver_action)
 
-        import_export_menu = QtWidgets.QMenu("Import/Export:", menu)
-
-        if solver:
-            import_export_menu.addAction(export_driver_action)
-            import_export_menu.addAction(export_all_action)
-            import_export_menu.addSeparator()
+        import_export_menu = QtWidgets.QMenu("Import/Export:", self._driver_menu)
+        import_export_menu.addAction(self._export_driver_action)
+        import_export_menu.addAction(self._export_all_action)
+        self._export_separator = import_export_menu.addSeparator()
         import_export_menu.addAction(import_driver_action)
 
-        add_menu = QtWidgets.QMenu("Add:", menu)
+        add_menu = QtWidgets.QMenu("Add:", self._driver_menu)
         add_menu.addAction(add_driven_action)
 
-        utilities_menu = QtWidgets.QMenu("Utilities:", menu)
+        utilities_menu = QtWidgets.QMenu("Utilities:", self._driver_menu)
         utilities_menu.addAction(zero_base_pose_action)
 
-        if solver:
-            # if the solver is enabled show the edit and otherwise show the enable
-            if solver.is_enabled:
-                menu.addAction(edit_action)
-            else:
-                menu.addAction(enable_action)
-            menu.addSeparator()
-            menu.addMenu(select_menu)
-            menu.addMenu(add_menu)
-            menu.addMenu(mirror_menu)
-            menu.addMenu(utilities_menu)
+        self._driver_menu.addAction(self._edit_action)
+        self._driver_menu.addAction(self._enable_action)
+        # Store the entries that are only shown when a solver is selected
+        self._solver_menu_actions = [
+            self._driver_menu.addSeparator(),
+            self._driver_menu.addMenu(select_menu),
+            self._driver_menu.addMenu(add_menu),
+            self._driver_menu.addMenu(mirror_menu),
+            self._driver_menu.addMenu(utilities_menu),
+            self._export_driver_action,
+            self._export_all_action,
+            self._export_separator
+        ]
+
+        self._driver_menu.addMenu(import_export_menu)
+
+    def driver_popup(self, point):
+        """add  right click menu"""
+
+        selected_solvers = self.get_selected_solvers()
+        solver = None
+        if selected_solvers:
+            solver = selected_solvers[-1]
+
+        # if the solver is enabled show the edit and otherwise show the enable
+        self._edit_action.setVisible(bool(solver) and solver.is_enabled)
+        self._enable_action.setVisible(bool(solver) and not solver.is_enabled)
+        for action in self._solver_menu_actions:
+            action.setVisible(bool(solver))
+
+        self._driver_menu.popup(self.win.driver_LIST.mapToGlobal(point))
+
+    def _update_selected_solvers(self):
+        """caches the selected solvers, called before any other slot when the driver selection changes"""
+
+        self._selected_solvers = [item.data(QtCore.Qt.UserRole) for item in self.win.driver_LIST.selectedItems()]
 
-        menu.addMenu(import_export_menu)
+    def _update_selected_poses(self):
+        """caches the selected poses, called before any other slot when the pose selection changes"""
 
-        menu.popup(self.win.driver_LIST.mapToGlobal(point))
+        self._selected_poses = [item.text() for item in self.win.pose_LIST.selectedItems()]
 
     def get_selected_solvers(self):
         """gets the selected solvers"""
 
-        selected_items = self.win.driver_LIST.selectedItems()
-
-        selected_solvers = []
-        if selected_items:
-            for item in selected_items:
-                solver = item.data(QtCore.Qt.UserRole)
-                selected_solvers.append(solver)
-        return selected_solvers
+        return self._selected_solvers
 
     def get_selected_poses(self):
         """gets the selected poses"""
 
-        selected_items = self.win.pose_LIST.selectedItems()
-        selected_poses = []
-        if selected_items:
-            for item in selected_items:
-                pose = item.text()
-                selected_poses.append(pose)
-        return selected_poses
+        return self._selected_poses
 
     def add_pose(self):
         """add a new pose to the driver"""
@@ -302,52 +413,48 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
     def driver_changed(self):
         """function that gets called with the driver/solver is clicked"""
 
-        selected_solvers = self.get_selected_solvers()
+        self.load_driven_transforms()
+        if not self.get_selected_solvers():
+            self.win.driver_transform_LINE.setText("")
+
+        self.refresh_ui_state()
+        self.load_poses()
+
+    def load_driven_transforms(self):
+        """loads the driven transforms for the current driver"""
 
-        self.win.driven_transforms_LIST.clear()
+        # Clearing the list would otherwise run driven_changed and clear the scene selection
+        with utils.signals_blocked(self.win.driven_transforms_LIST):
+            self.win.driven_transforms_LIST.clear()
+        selected_solvers = self.get_selected_solvers()
         if selected_solvers:
             solver = selected_solvers[-1]
             driven_transforms = solver.driven_transforms
             if driven_transforms:
-                for transform in driven_transforms:
-                    item = QtWidgets.QListWidgetItem(transform)
-                    self.win.driven_transforms_LIST.addItem(item)
-        else:
-            self.win.driver_transform_LINE.setText("")
-
-        self.refresh_ui_state()
-        self.load_poses()
+                _batch_fill(self.win.driven_transforms_LIST, [(transform, None) for transform in driven_transforms])
 
     def driven_changed(self):
         """select the driven transforms when picked in the UI"""
 
         selected_items = self.win.driven_transforms_LIST.selectedItems()
-        cmds.select(cl=1)
-        for item in selected_items:
-            cmds.select(item.text(), add=1)
+        _replace_selection([item.text() for item in selected_items])
 
     def select_driver(self):
         """selects the driver(s)"""
 
-        cmds.select(cl=1)
         selected_solvers = self.get_selected_solvers()
-        for solver in selected_solvers:
-            cmds.select(solver.driving_transform, add=1)
+        _replace_selection([solver.driving_transform for solver in selected_solvers])
 
     def select_driven(self):
         """selects the driven"""
-        cmds.select(cl=1)
         selected_solvers = self.get_selected_solvers()
-        for solver in selected_solvers:
-            cmds.select(solver.driven_transforms, add=1)
+        _replace_selection([driven for solver in selected_solvers for driven in solver.driven_transforms or []])
 
     def select_solver(self):
         """selects the solver DG node"""
 
-        cmds.select(cl=1)
         selected_solvers = self.get_selected_solvers()
-        for solver in selected_solvers:
-            cmds.select(solver.name, add=1)
+        _replace_selection([solver.name for solver in selected_solvers])
 
     def bake_poses(self):
         """bakes the poses to the timeline"""
@@ -360,11 +467,10 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
     def add_new_driven(self):
         """adds new driven transforms to the selected drivers"""
 
-        selected_items = self.win.driver_LIST.selectedItems()
-
         sl = cmds.ls(sl=1)
         if not sl:
             OpenMaya.MGlobal.displayError("No driven object selected, please select a driven object to add")
+            return
 
         selected_solvers = self.get_selected_solvers()
         if selected_solvers:
@@ -372,7 +478,8 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
                 for s in sl:
                     solver.add_driven(s)
 
-        self.load_drivers(selected_items[-1].text())
+        # The driver list is unchanged, only the driven transforms of the current driver need reloading
+        self.load_driven_transforms()
 
     def edit_driver(self):
         """set the drivers into edit mode"""
@@ -453,10 +560,19 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             self.win.copy_driven_trs_BTN.setEnabled(False)
             self.win.paste_driven_trs_BTN.setEnabled(False)
 
+        # Store the lookups used in the loop
+        get_item = self.win.driver_LIST.item
+        role = QtCore.Qt.UserRole
+        last_enabled_state = self._last_enabled_state
         for i in range(self.win.driver_LIST.count()):
-            item = self.win.driver_LIST.item(i)
-            solver = item.data(QtCore.Qt.UserRole)
-            if not solver.is_enabled:
+            item = get_item(i)
+            solver = item.data(role)
+            is_enabled = solver.is_enabled
+            # Only update the text of items whose state has changed since the last refresh
+            if last_enabled_state.get(solver.name) == is_enabled:
+                continue
+            last_enabled_state[solver.name] = is_enabled
+            if not is_enabled:
                 item.setText(solver.name + " (Editing)")
             else:
                 item.setText(solver.name)
@@ -469,50 +585,74 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             selected_pose = selected_poses[-1]
             selected_solvers = self.get_selected_solvers()
             solver = selected_solvers[-1]
-            if selected_pose in solver.pose_dict.keys():
+            if selected_pose in solver.pose_dict:
                 solver.assume_pose(selected_pose)
             else:
                 cmds.warning('Pose ' + selected_pose + ' not found in pose dictionary')
         self.refresh_ui_state()
 
     def load_drivers(self, selected=None):
-        """loads all the RBF node drivers into the driver list widget"""
-
-        self.win.driver_LIST.clear()
-        drivers = [node for node in cmds.ls(type=self._node_name)]
-        selected_item = None
-        for driver in drivers:
-            item = QtWidgets.QListWidgetItem(driver)
-            solver = poseWrangler.UE4PoseDriver(existing_interpolator=driver)
-            item.setData(QtCore.Qt.UserRole, solver)
-            if selected and selected == driver:
-                selected_item = item
-
-            self.win.driver_LIST.addItem(item)
-
-        self.win.driver_LIST.sortItems(QtCore.Qt.AscendingOrder)
-        if selected_item:
-            self.win.driver_LIST.setCurrentItem(selected_item)
-
-        self.refresh_ui_state()
-        self.load_poses()
+        """
+        loads all the RBF node drivers into the driver list widget
+        :param selected :type poseWrangler.UE4PoseDriver or str: optional solver or solver node name to select
+        """
+
+        # The new items are created with the plain solver name, so the enabled state has to be checked again
+        self._last_enabled_state = {}
+        # Sort the names up front so the items are added in order and the list doesn't need sorting
+        drivers = sorted(cmds.ls(type=self._node_name) or [])
+        # Only create wrappers for solvers that have been added since the last refresh and drop the ones that no
+        # longer exist, the wrappers query the scene directly so existing ones are still valid
+        current = set(drivers)
+        cached = set(self._solver_cache)
+        pose_driver = poseWrangler.UE4PoseDriver
+        for driver in current - cached:
+            self._solver_cache[driver] = pose_driver(existing_interpolator=driver)
+        for driver in cached - current:
+            del self._solver_cache[driver]
+        # Clearing and reselecting would each run driver_changed, so block the signals and run it once at the end
+        with utils.signals_blocked(self.win.driver_LIST):
+            self.win.driver_LIST.clear()
+            items = _batch_fill(self.win.driver_LIST, [(driver, self._solver_cache[driver]) for driver in drivers])
+            if selected is not None:
+                for driver, item in zip(drivers, items):
+                    # Match the solver wrapper by identity, falling back to the node name
+                    if selected is self._solver_cache[driver] or selected == driver:
+                        self.win.driver_LIST.setCurrentItem(item)
+                        break
+
+        # Update the cached selection and reload the driven transforms and poses for it
+        self._update_selected_solvers()
+        self.driver_changed()
+
+    def eventFilter(self, watched, event):
+        """
+        Populate the pose list if it was reloaded while it was hidden
+        :param watched :type QtCore.QObject: object the event was sent to
+        :param event :type QtCore.QEvent: event
+        :return :type bool: True if the event was handled
+        """
+        if event.type() == QtCore.QEvent.Show and watched is self.win.pose_LIST and self._poses_dirty:
+            self.load_poses()
+        return super(PoseWrangler, self).eventFilter(watched, event)
 
     def load_poses(self):
         """loads the poses for the current driver"""
 
-        self.win.pose_LIST.clear()
+        # Clear without running pose_changed, the cached pose selection is reset directly
+        with utils.signals_blocked(self.win.pose_LIST):
+            self.win.pose_LIST.clear()
+        self._selected_poses = []
+        # Querying the poses from the solver is the expensive part, so wait until the list is shown to fill it
+        if not self.win.pose_LIST.isVisible():
+            self._poses_dirty = True
+            return
+        self._poses_dirty = False
         selected_solvers = self.get_selected_solvers()
         if selected_solvers:
             solver = selected_solvers[-1]
-            for target in solver.pose_dict.keys() or []:
-                item = QtWidgets.QListWidgetItem()
-                item.setText(target)
-                item.setData(QtCore.Qt.UserRole, target)
-
-                self.win.pose_LIST.addItem(item)
-
-        # sort the items
-        self.win.pose_LIST.sortItems(QtCore.Qt.AscendingOrder)
+            # add the items in sorted order
+            _batch_fill(self.win.pose_LIST, [(target, target) for target in sorted(solver.pose_dict or [])])
 
     def mirror_pose(self):
         """mirrors the selected pose for the current driver"""
@@ -524,9 +664,10 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         solver = selected_solvers[-1]
         selected_poses = self.get_selected_poses()
         if selected_poses:
+            # pose_dict is queried from the solver node, so only build it once for all the selected poses
+            pose_dict = solver.pose_dict
             for selected_pose in selected_poses:
-                pose_dict = solver.pose_dict
-                if selected_pose in pose_dict.keys():
+                if selected_pose in pose_dict:
                     poseWrangler.mirror_pose_driver(
                         solver.name, pose=selected_pose
                     )
@@ -537,10 +678,11 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """mirrors all poses for the selected drivers"""
 
         selected_solvers = self.get_selected_solvers()
-        for solver in selected_solvers:
-            poseWrangler.mirror_pose_driver(solver.name)
+        with _suspend_updates(self):
+            for solver in selected_solvers:
+                poseWrangler.mirror_pose_driver(solver.name)
 
-        self.load_drivers()
+            self.load_drivers()
 
     def import_drivers(self, file_path=""):
         """imports the drivers"""
@@ -556,10 +698,10 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             OpenMaya.MGlobal.displayError(path + " is not a valid file.")
             return
 
-        poseWrangler.import_drivers(path)
+        with _suspend_updates(self):
+            poseWrangler.import_drivers(path)
 
-        self.load_drivers()
-        self.load_poses()
+            self.load_drivers()
 
     def export_driver(self):
         """exports the selected drivers"""
@@ -601,23 +743,43 @@ class PoseWrangler(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
 
         # takes all driven and the driving input is last
         interp_name, ok = QtWidgets.QInputDialog.getText(self, 'text', 'Driver Name:')
-        if interp_name:
+        if not interp_name:
+            return
+        with _suspend_updates(self):
             driver = poseWrangler.UE4PoseDriver()
             driver.create_pose_driver_system(interp_name, sel[-1], sel[0:-1])
             self._current_solver = driver
-        # refresh the combobox and set this interpolator as current
-        self.load_drivers(selected=self._current_solver.name if self._current_solver else None)
+            # add the new driver to the list and set it as current
+            self.win.driver_LIST.setCurrentItem(self._append_driver_item(driver.name, driver))
+
+    def _append_driver_item(self, driver_name, solver):
+        """
+        Add a single driver to the driver list in sorted order without reloading the other drivers
+        :param driver_name :type str: name of the solver node
+        :param solver :type poseWrangler.UE4PoseDriver: solver wrapper stored on the item
+        :return :type QtWidgets.QListWidgetItem: new item
+        """
+        self._solver_cache[driver_name] = solver
+        # The item text can have an editing suffix, so find the sorted position from the solver names
+        names = [
+            self.win.driver_LIST.item(i).data(QtCore.Qt.UserRole).name for i in range(self.win.driver_LIST.count())
+        ]
+        item = QtWidgets.QListWidgetItem(driver_name)
+        item.setData(QtCore.Qt.UserRole, solver)
+        with utils.signals_blocked(self.win.driver_LIST):
+            self.win.driver_LIST.insertItem(bisect.bisect(names, driver_name), item)
+        return item
 
     def delete_driver(self):
         """deletes the selected drivers"""
 
         selected_solvers = self.get_selected_solvers()
-        if selected_solvers:
-            for solver in selected_solvers:
-                solver.delete()
+        with _suspend_updates(self):
+            if selected_solvers:
+                for solver in selected_solvers:
+                    solver.delete()
 
-        self.load_drivers()
-        self.load_poses()
+            self.load_drivers()
 
     def copy_driven_trs(self):
         """copies the driven TRS for pasting in different poses"""
@@ -5,7 +5,7 @@ import re
 
 import six
 import json
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 
 from maya import cmds
 from maya import OpenMaya
@@ -14,9 +14,34 @@ from maya.api import OpenMaya as om
 from epic_pose_wrangler.log import LOG
 from epic_pose_wrangler.v2.model import exceptions, pose_blender, utils
 
+# Blendshape connection data for a single blendshape mesh associated with a pose
+BlendshapeData = namedtuple(
+    'BlendshapeData', [
+        # Blendshape Transform Node
+        'blendshape_mesh',
+        # Blendshape Shape Node
+        'blendshape_mesh_shape',
+        # Original Mesh Transform Node
+        'orig_mesh',
+        # Blendshape Node
+        'blendshape',
+        # orig_mesh.blendShapeMeshes index for this blendshape mesh
+        'blendshape_mesh_orig_index',
+        # Index of the blendshape transform node on the blendshape node
+        'mesh_index',
+        # The attribute name
+        'pose_attr',
+        'pose_index'
+    ]
+)
+
 
 class RBFNode(object):
     node_type = 'UERBFSolverNode'
+    # Handles to the solver nodes found by find_all, cleared whenever a solver is added or removed from the scene
+    _find_all_cache = None
+    # Callback ids used to invalidate the find_all cache
+    _callback_ids = []
 
     def __init__(self, node):
         """
@@ -147,7 +172,91 @@ class RBFNode(object):
         """
         Returns all RBF nodes in scene
         """
-        return [cls(node) for node in cmds.ls(type=cls.node_type)]
+        if RBFNode._find_all_cache is None:
+            nodes = cmds.ls(type=cls.node_type)
+            cls.add_callbacks()
+            # If the callbacks couldn't be registered the cache can't be invalidated, so don't store it
+            if not RBFNode._callback_ids:
+                return [cls(node) for node in nodes]
+            RBFNode._find_all_cache = [
+                om.MObjectHandle(om.MGlobal.getSelectionListByName(node).getDependNode(0)) for node in nodes
+            ]
+        # Node names are resolved from the cached handles so that renamed solvers are still returned correctly
+        return [
+            cls(om.MFnDependencyNode(handle.object()).name()) for handle in RBFNode._find_all_cache
+            if handle.isValid()
+        ]
+
+    @classmethod
+    def go_to_default_all(cls, exclude=None):
+        """
+        Moves every solver in the scene that has a default pose to that pose as a single batch
+        :param exclude :type list: optional list of solvers to leave untouched
+        """
+        exclude = [str(solver) for solver in exclude or []]
+        solvers = [
+            solver for solver in cls.find_all() if str(solver) not in exclude and solver.pose_index('default') >= 0
+        ]
+        if not solvers:
+            return
+
+        cmds.undoInfo(openChunk=True)
+        try:
+            # Switch to DG evaluation whilst the poses are set so the graph is only evaluated once at the end
+            with utils.suspend_evaluation():
+                for solver in solvers:
+                    solver.go_to_pose('default')
+                # Only dirty the solvers that were moved rather than every plug in the scene
+                cmds.dgdirty([str(solver) for solver in solvers])
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    @classmethod
+    def add_callbacks(cls):
+        """
+        Registers the callbacks used to invalidate the find_all cache
+        """
+        if RBFNode._callback_ids:
+            return
+        try:
+            RBFNode._callback_ids = [
+                om.MDGMessage.addNodeAddedCallback(cls._invalidate_find_all_cache, cls.node_type),
+                om.MDGMessage.addNodeRemovedCallback(cls._invalidate_find_all_cache, cls.node_type),
+                om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, cls._invalidate_find_all_cache),
+                om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, cls._invalidate_find_all_cache),
+                om.MSceneMessage.addStringArrayCallback(
+                    om.MSceneMessage.kBeforePluginUnload, cls._on_before_plugin_unload
+                )
+            ]
+        except RuntimeError as e:
+            LOG.warning("Unable to register {node_type} callbacks: {exception}".format(
+                node_type=cls.node_type, exception=e)
+            )
+            cls.remove_callbacks()
+
+    @classmethod
+    def remove_callbacks(cls):
+        """
+        Deregisters the find_all cache callbacks and clears the cache
+        """
+        if RBFNode._callback_ids:
+            om.MMessage.removeCallbacks(RBFNode._callback_ids)
+        RBFNode._callback_ids = []
+        RBFNode._find_all_cache = None
+
+    @staticmethod
+    def _invalidate_find_all_cache(*args):
+        """
+        Clears the find_all cache so that the next call rescans the scene
+        """
+        RBFNode._find_all_cache = None
+
+    @staticmethod
+    def _on_before_plugin_unload(*args):
+        """
+        Removes the callbacks before the plugin defining the solver node type is unloaded
+        """
+        RBFNode.remove_callbacks()
 
     # ----------------------------------------------------------------------------------------------
     #                                       PARAMETERS
@@ -570,11 +679,9 @@ class RBFNode(object):
         Returns pose index
         """
 
-        poses_indices = cmds.getAttr('{}.targets'.format(self), multiIndices=True)
-        if poses_indices:
-            for pose_index in poses_indices:
-                if pose_name == cmds.getAttr('{}.targets[{}].targetName'.format(self, pose_index)):
-                    return pose_index
+        for pose_index, target_name in self._target_names():
+            if target_name == pose_name:
+                return pose_index
 
         return -1
 
@@ -648,7 +755,7 @@ class RBFNode(object):
         pose_data['target_enable'] = cmds.getAttr(
             '{solver}.targets[{index}].targetEnable'.format(solver=self, index=pose_index)
         )
-        pose_data['blendshape_data'] = self.get_blendshape_data_for_pose(pose_name) or []
+        pose_data['blendshape_data'] = [dict(data._asdict()) for data in self.get_blendshape_data_for_pose(pose_name)]
 
         return pose_data
 
@@ -851,11 +958,7 @@ class RBFNode(object):
         # Check if the solver already exists
         match = [s for s in self.find_all() if str(s) == target_solver_name]
         # Force the base pose
-        for solver in self.find_all():
-            if solver == self:
-                continue
-            if solver.has_pose('default'):
-                solver.go_to_pose('default')
+        self.go_to_default_all(exclude=[self])
         # If it does, use it
         if match:
             new_solver = match[0]
@@ -1079,9 +1182,7 @@ class RBFNode(object):
                 pose_blender_node.edit = edit
 
         # Force the base pose
-        for solver in self.find_all():
-            if solver != self and solver.has_pose('default'):
-                solver.go_to_pose('default')
+        self.go_to_default_all(exclude=[self])
 
     def get_solver_edit_status(self):
         """
@@ -1246,14 +1347,14 @@ class RBFNode(object):
         if not blendshape_data:
             return
         for data in blendshape_data:
-            orig_mesh = data['orig_mesh']
-            blendshape_mesh = data['blendshape_mesh']
-            blendshape_mesh_shape = data['blendshape_mesh_shape']
-            blendshape_mesh_orig_index = data['blendshape_mesh_orig_index']
-            mesh_index = data['mesh_index']
-            pose_index = data['pose_index']
-            blendshape = data['blendshape']
-            pose_attr = data['pose_attr']
+            orig_mesh = data.orig_mesh
+            blendshape_mesh = data.blendshape_mesh
+            blendshape_mesh_shape = data.blendshape_mesh_shape
+            blendshape_mesh_orig_index = data.blendshape_mesh_orig_index
+            mesh_index = data.mesh_index
+            pose_index = data.pose_index
+            blendshape = data.blendshape
+            pose_attr = data.pose_attr
 
             mesh_index_attr = '{blendshape}.meshes[{mesh_index}]'.format(blendshape=blendshape, mesh_index=mesh_index)
             weight_index_attr = '{blendshape}.weight[{mesh_index}]'.format(blendshape=blendshape, mesh_index=mesh_index)
@@ -1334,8 +1435,8 @@ class RBFNode(object):
             utils.connect_attr(pose_attr, '{blendshape_mesh}.poseName'.format(blendshape_mesh=new_blendshape_mesh))
 
             if edit:
-                cmds.select(new_blendshape_mesh, replace=True)
                 cmds.hide(orig_mesh)
+                cmds.select(new_blendshape_mesh, replace=True)
             else:
                 self.add_existing_blendshape(
                     pose_name=pose_name, blendshape_mesh=new_blendshape_mesh, base_mesh=orig_mesh
@@ -1357,11 +1458,7 @@ class RBFNode(object):
         # If we don't have any output attributes, there's nothing to isolate
         if output_attributes:
             # Force default pose on everything bar this solver
-            for solver in self.find_all():
-                if solver == self:
-                    continue
-                if solver.has_pose('default'):
-                    solver.go_to_pose(pose_name='default')
+            self.go_to_default_all(exclude=[self])
             # If we are isolating, we want to disconnect all the other blendshapes connected to this solver
             if isolate:
                 # Iterate through the output attributes
@@ -1381,6 +1478,8 @@ class RBFNode(object):
                         # final rendered mesh
                         cmds.setAttr(con, 0.0)
             else:
+                # Cache of transform: has blendShape attr, transforms are often shared between poses
+                has_blendshape_attr = {}
                 # Undo the isolation, reconnecting all the attributes
                 for index, attr in enumerate(output_attributes):
                     # Generate the pose name attr for this index
@@ -1393,7 +1492,11 @@ class RBFNode(object):
                     # For each transform
                     for transform in transforms:
                         # Check if it has a blendshape attr, will be missing if blendshapes aren't added via the API
-                        if cmds.attributeQuery("blendShape", node=transform, exists=True):
+                        if transform not in has_blendshape_attr:
+                            has_blendshape_attr[transform] = cmds.attributeQuery(
+                                "blendShape", node=transform, exists=True
+                            )
+                        if has_blendshape_attr[transform]:
                             # Generate the blendshape attribute name
                             blendshape_attr = "{transform}.blendShape".format(transform=transform)
                             # Iterate through each connected blendshape
@@ -1510,10 +1613,8 @@ class RBFNode(object):
             )
         target_index = blendshape_mesh_plugs.index(target_plug)
         # Find the mirror axis from the drivers
-        current_drivers = [cmds.xform(driver, query=True, translation=True, worldSpace=True) for driver in
-                           self.drivers()]
-        mirrored_drivers = [cmds.xform(driver, query=True, translation=True, worldSpace=True) for driver in
-                            new_solver.drivers()]
+        current_drivers = utils.get_world_translations(self.drivers())
+        mirrored_drivers = utils.get_world_translations(new_solver.drivers())
 
         # Find the mirrored axis
         mirror_axis = self._get_mirrored_axis(source_transforms=current_drivers, mirrored_transforms=mirrored_drivers)
@@ -1549,58 +1650,57 @@ class RBFNode(object):
         """
         Delete the blendshape associated with the specified pose
         :param pose_name :type str: name of the pose to delete blendshapes for
-        :param blendshape_data :type dict or None: optional blendshape data
+        :param blendshape_data :type list of BlendshapeData or None: optional blendshape data
         :param delete_mesh :type bool: True = mesh will be deleted, False = connections will be broken
         """
-        # Delete all the blendshapes associated with the specified pose
-        for data in blendshape_data or self.get_blendshape_data_for_pose(pose_name=pose_name):
-            # Get the blendshape, blendshape mesh and target index from the blendshape data
-            blendshape = data['blendshape']
-            blendshape_mesh = data['blendshape_mesh']
-            mesh_index = data['mesh_index']
-            # Remove the attributes at the target index
-            cmds.removeMultiInstance(
-                '{blendshape}.meshes[{index}]'.format(
-                    blendshape=blendshape,
-                    index=mesh_index
-                ), b=True
-            )
-            cmds.removeMultiInstance(
-                '{blendshape}.weight[{index}]'.format(
-                    blendshape=blendshape,
-                    index=mesh_index
-                ), b=True
-            )
-            cmds.removeMultiInstance(
-                '{blendshape}.inputTarget[0].inputTargetGroup[{index}]'.format(
-                    blendshape=blendshape,
-                    index=mesh_index
-                ), b=True
-            )
-            cmds.aliasAttr(
-                'weight{index}'.format(index=mesh_index), '{blendshape}.weight[{index}]'.format(
-                    blendshape=blendshape,
-                    index=mesh_index
-                )
-            )
-
+        with utils.suspend_refresh():
             pose_index = self.pose_index(pose_name=pose_name)
+            # Delete all the blendshapes associated with the specified pose
+            for data in blendshape_data or self.get_blendshape_data_for_pose(pose_name=pose_name):
+                # Get the blendshape, blendshape mesh and target index from the blendshape data
+                blendshape = data.blendshape
+                blendshape_mesh = data.blendshape_mesh
+                mesh_index = data.mesh_index
+                # Remove the attributes at the target index
+                cmds.removeMultiInstance(
+                    '{blendshape}.meshes[{index}]'.format(
+                        blendshape=blendshape,
+                        index=mesh_index
+                    ), b=True
+                )
+                cmds.removeMultiInstance(
+                    '{blendshape}.weight[{index}]'.format(
+                        blendshape=blendshape,
+                        index=mesh_index
+                    ), b=True
+                )
+                cmds.removeMultiInstance(
+                    '{blendshape}.inputTarget[0].inputTargetGroup[{index}]'.format(
+                        blendshape=blendshape,
+                        index=mesh_index
+                    ), b=True
+                )
+                cmds.aliasAttr(
+                    'weight{index}'.format(index=mesh_index), '{blendshape}.weight[{index}]'.format(
+                        blendshape=blendshape,
+                        index=mesh_index
+                    )
+                )
 
-            from_attr = "{self}.targets[{pose_index}].targetName".format(self=self, pose_index=pose_index)
-            to_attr = "{blendshape}.poseName".format(blendshape=blendshape_mesh)
+                from_attr = "{self}.targets[{pose_index}].targetName".format(self=self, pose_index=pose_index)
+                to_attr = "{blendshape}.poseName".format(blendshape=blendshape_mesh)
 
-            cmds.disconnectAttr(from_attr, to_attr)
+                cmds.disconnectAttr(from_attr, to_attr)
 
-            # Delete the mesh
-            if cmds.objExists(blendshape_mesh) and delete_mesh:
-                cmds.select(blendshape_mesh, replace=True)
-                cmds.delete(blendshape_mesh)
+                # Delete the mesh
+                if cmds.objExists(blendshape_mesh) and delete_mesh:
+                    cmds.delete(blendshape_mesh)
 
     def get_blendshape_data_for_pose(self, pose_name):
         """
         Get all the blendshape data associated with the specified pose name
         :param pose_name :type str: pose name
-        :return :type list of dictionaries: blendshape data
+        :return :type list of BlendshapeData: blendshape data
         """
         blendshape_data = []
         # Get the pose index for this name
@@ -1676,23 +1776,16 @@ class RBFNode(object):
             blendshape_mesh_orig_index = orig_mesh_plugs.index(blendshape_mesh_orig_plug)
 
             blendshape_data.append(
-                {
-                    # Blendshape Transform Node
-                    'blendshape_mesh': blendshape_mesh,
-                    # Blendshape Shape Node
-                    'blendshape_mesh_shape': blendshape_mesh_shape,
-                    # Original Mesh Transform Node
-                    'orig_mesh': orig_mesh,
-                    # Blendshape Node
-                    'blendshape': blendshape,
-                    # orig_mesh.blendShapeMeshes index for this blendshape mesh
-                    'blendshape_mesh_orig_index': blendshape_mesh_orig_index,
-                    # Index of the blendshape transform node on the blendshape node
-                    'mesh_index': target_index,
-                    # The attribute name
-                    'pose_attr': target_name_attr,
-                    'pose_index': pose_index
-                }
+                BlendshapeData(
+                    blendshape_mesh=blendshape_mesh,
+                    blendshape_mesh_shape=blendshape_mesh_shape,
+                    orig_mesh=orig_mesh,
+                    blendshape=blendshape,
+                    blendshape_mesh_orig_index=blendshape_mesh_orig_index,
+                    mesh_index=target_index,
+                    pose_attr=target_name_attr,
+                    pose_index=pose_index
+                )
             )
         return blendshape_data
 
@@ -1751,13 +1844,7 @@ class RBFNode(object):
         Returns unnamed poses indices
         """
 
-        unnamed_poses = list()
-        poses_indices = cmds.getAttr('{}.targets'.format(self), multiIndices=True)
-        for pose_index in poses_indices:
-            if not self.pose_name(pose_index):
-                unnamed_poses.append(pose_index)
-
-        return unnamed_poses
+        return [pose_index for pose_index, pose_name in self._target_names() if not pose_name]
 
     def name_unnamed_poses(self, basename='pose'):
         """
@@ -1768,16 +1855,23 @@ class RBFNode(object):
         """
 
         pose_names = list()
-        for pose_index in self.unnamed_poses_indices():
+        target_names = self._target_names()
+        # store the existing names so uniqueness can be checked without re-querying the node for every candidate
+        taken = set(pose_name for _, pose_name in target_names if pose_name)
+
+        for pose_index in [pose_index for pose_index, pose_name in target_names if not pose_name]:
 
             # add index to basename
             pose_name = '{}_{}'.format(basename, pose_index)
 
             # make sure is unique name
-            while self.has_pose(pose_name):
-                pose_name = '{}_{}'.format(basename, pose_index + 1)
+            suffix = pose_index
+            while pose_name in taken:
+                suffix += 1
+                pose_name = '{}_{}'.format(basename, suffix)
 
-            self.rename_pose(pose_index, pose_name)
+            cmds.setAttr('{}.targets[{}].targetName'.format(self, pose_index), pose_name, type='string')
+            taken.add(pose_name)
             pose_names.append(pose_name)
 
         return pose_names
@@ -1832,9 +1926,7 @@ class RBFNode(object):
                 self.mirror_pose(pose_name=pose_name, mirror_mapping=mirror_mapping)
 
             # Force the base pose
-            for solver in self.find_all():
-                if solver.has_pose('default'):
-                    solver.go_to_pose('default')
+            self.go_to_default_all()
         # If we aren't mirroring poses, create the default pose
         else:
             mirrored_solver.add_pose_from_current(pose_name='default')
@@ -1878,6 +1970,22 @@ class RBFNode(object):
         else:
             cmds.setAttr(attribute, value)
 
+    def _target_names(self):
+        """
+        Reads every target name from the node in a single pass over the targets plug
+        :return :type list: list of (pose index, pose name) tuples
+        """
+        selection_list = om.MSelectionList()
+        selection_list.add('{}.targets'.format(self))
+        targets_plug = selection_list.getPlug(0)
+        target_name_attr = om.MFnDependencyNode(targets_plug.node()).attribute('targetName')
+
+        target_names = list()
+        for physical_index in range(targets_plug.numElements()):
+            element_plug = targets_plug.elementByPhysicalIndex(physical_index)
+            target_names.append((element_plug.logicalIndex(), element_plug.child(target_name_attr).asString()))
+        return target_names
+
     def _get_mirrored_axis(self, source_transforms, mirrored_transforms):
         axis_names = 'xyz'
         for index, driver in enumerate(source_transforms):
@@ -1905,19 +2013,19 @@ class RBFNode(object):
                 )
             )
 
+        source_syntax = mirror_mapping.source_solver_syntax
+        target_syntax = mirror_mapping.target_solver_syntax
+        # Map each side's syntax to the opposite side. I.e if the source is _l_, change it to _r_
+        swap = {source_syntax: target_syntax, target_syntax: source_syntax}
         # Generate the new pose driver name
         target_rbf_solver_name = ""
         for group in match.groups():
-            # If the the group matches the source solver syntax, change the group to be the target syntax.
-            # I.e if the source is _l_, change it to _r_
-            if group == mirror_mapping.source_solver_syntax:
-                group = mirror_mapping.target_solver_syntax
-            # If the group matches the target, change the group to the source and swap the sides in the config
-            elif group == mirror_mapping.target_solver_syntax:
-                group = mirror_mapping.source_solver_syntax
+            # If the group matches the target, swap the sides in the config
+            if group == target_syntax and group != source_syntax:
                 mirror_mapping.swap_sides()
-            # Add the group name to generate the new name for the solver
-            target_rbf_solver_name += group
+                source_syntax, target_syntax = target_syntax, source_syntax
+            # Add the mirrored group name to generate the new name for the solver
+            target_rbf_solver_name += swap.get(group, group)
         return target_rbf_solver_name
 
     def _get_mirrored_transforms(self, transforms, mirror_mapping, ignore_invalid_nodes=False):
@@ -1927,6 +2035,11 @@ class RBFNode(object):
         :param mirror_mapping :type pose_wrangler.model.mirror_mapping.MirrorMapping: mirror mapping ref
         :return :type list: list of mirrored transform names
         """
+        # Map each side's syntax to the opposite side
+        swap = {
+            mirror_mapping.source_transform_syntax: mirror_mapping.target_transform_syntax,
+            mirror_mapping.target_transform_syntax: mirror_mapping.source_transform_syntax
+        }
         # Generate empty list to store the newly mapped transforms
         new_transforms = []
         for transform in transforms:
@@ -1941,25 +2054,21 @@ class RBFNode(object):
                         expression=mirror_mapping.transform_expression
                     )
                 )
-            # Generate the new pose transform name
-            target_transform_name = ""
-            # Iterate through the groups
-            for group in match.groups():
-                # If the the group matches the source transform syntax, change the group to be the target syntax.
-                if group == mirror_mapping.source_transform_syntax:
-                    group = mirror_mapping.target_transform_syntax
-                elif group == mirror_mapping.target_transform_syntax:
-                    group = mirror_mapping.source_transform_syntax
-                # Add the group name to generate the new name for the transform
-                target_transform_name += group
-            # If the generated transform name doesn't exist, raise exception
-            if not cmds.ls(target_transform_name) and not ignore_invalid_nodes:
-                raise exceptions.exceptions.InvalidMirrorMapping(
-                    "Unable to mirror transform '{transform}'. Target transform does not exist: '{target}'".format(
-                        transform=transform,
-                        target=target_transform_name
-                    )
-                )
+            # Generate the new pose transform name from the mirrored groups
+            target_transform_name = "".join(swap.get(group, group) for group in match.groups())
             # Add the new transform to the list
             new_transforms.append(target_transform_name)
+
+        if not ignore_invalid_nodes:
+            for transform, target_transform_name in zip(transforms, new_transforms):
+                # If the generated transform name doesn't exist, raise exception. cmds.ls returns shortened or
+                # full paths rather than the names passed in, so each name is checked individually
+                if not cmds.objExists(target_transform_name):
+                    raise exceptions.exceptions.InvalidMirrorMapping(
+                        "Unable to mirror transform '{transform}'. Target transform does not exist: "
+                        "'{target}'".format(
+                            transform=transform,
+                            target=target_transform_name
+                        )
+                    )
         return new_transforms
@@ -1,6 +1,12 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
+import contextlib
+import multiprocessing
 import os
 import json
+import subprocess
+import sys
+from multiprocessing.pool import ThreadPool
+
 from maya import cmds
 
 from special_projects.publish_tools.fbx_cmd import fbx_export
@@ -8,6 +14,86 @@ from special_projects.publish_tools.utils import find_top_joints
 
 from special_projects.rigging.rbf_node import RBFNode
 
+# Write buffer size in bytes used for the JSON sidecar
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+
+# Script run by each mayapy subprocess to export a single solver from a freshly opened rig scene
+_SUBPROCESS_EXPORT_SCRIPT = """
+import maya.standalone
+maya.standalone.initialize()
+from maya import cmds
+cmds.file({rig_scene!r}, open=True, force=True)
+from {module} import RBFNodeExporter
+RBFNodeExporter({node!r}, {asset_name!r}, {export_directory!r}).export()
+"""
+
+
+def _mayapy_path():
+    """
+    Returns the path to the mayapy executable for the running Maya, or None if it can't be found
+    """
+
+    maya_location = os.environ.get('MAYA_LOCATION')
+    if not maya_location:
+        return None
+    executable = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    mayapy = os.path.join(maya_location, 'bin', executable)
+    if not os.path.isfile(mayapy):
+        return None
+    return mayapy
+
+
+def _export_in_subprocess(mayapy, rig_scene, node, asset_name, export_directory):
+    """
+    Exports a single solver in a separate mayapy process
+    :param mayapy :type str: path to the mayapy executable
+    :return :type tuple: node name, return code, decoded process output
+    """
+
+    script = _SUBPROCESS_EXPORT_SCRIPT.format(
+        rig_scene=rig_scene, module=__name__, node=node, asset_name=asset_name, export_directory=export_directory
+    )
+    # make sure the subprocess can import the same modules as this session
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+    process = subprocess.Popen([mayapy, '-c', script], env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = process.communicate()[0]
+    # communicate returns bytes, decode them so the output is readable when logged
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', 'replace')
+    return node, process.returncode, output
+
+
+@contextlib.contextmanager
+def _suspend_viewport_and_dg():
+    """
+    Suspends viewport drawing, DG evaluation and the undo queue whilst baking
+    """
+
+    evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+    undo_state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    # only isolate panels that aren't already isolated so the user's isolate sets are left alone
+    panels = [panel for panel in cmds.getPanel(type='modelPanel') or []
+              if not cmds.isolateSelect(panel, query=True, state=True)]
+
+    cmds.evaluationManager(mode='off')
+    cmds.undoInfo(stateWithoutFlush=False)
+    cmds.refresh(suspend=True)
+    for panel in panels:
+        cmds.isolateSelect(panel, state=True)
+
+    try:
+        yield
+    finally:
+        for panel in panels:
+            cmds.isolateSelect(panel, state=False)
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(stateWithoutFlush=undo_state)
+        cmds.evaluationManager(mode=evaluation_mode)
+
 
 class RBFNodeExporter(object):
     """
@@ -56,10 +142,10 @@ class RBFNodeExporter(object):
         return self._export_directory
 
     def set_export_directory(self, directory):
-        if os.path.isdir(directory) and os.path.exists(directory):
-            self._export_directory = directory
-        else:
+        # isdir is False for missing paths, so a single stat covers both checks
+        if not os.path.isdir(directory):
             raise IOError('Export directory "{}" does not exists'.format(directory))
+        self._export_directory = directory
 
     def fbx_export_path(self):
         return self._fbx_export_path
@@ -80,8 +166,12 @@ class RBFNodeExporter(object):
         Exports FBX and sidecar JSON file
         """
 
-        self.fbx_export()
-        self.json_export()
+        # name the poses and find the root joint once, both exports need them
+        self.node().name_unnamed_poses()
+        root_joint = self.root_joint()
+
+        self._fbx_export(root_joint)
+        self._json_export()
 
     def json_export(self):
         """
@@ -89,23 +179,37 @@ class RBFNodeExporter(object):
         """
 
         self.node().name_unnamed_poses()
+        self._json_export()
+
+    def fbx_export(self):
+        """
+        Exports baked poses to FBX
+        """
+
+        self.node().name_unnamed_poses()
+        self._fbx_export(self.root_joint())
+
+    def _json_export(self):
+        """
+        Exports JSON sidecar, expects the poses to already be named
+        """
 
         config = self._node.data()
         config['export_fbx'] = self.fbx_export_path()
         config['asset_name'] = self.asset_name()
 
-        with open(self.json_export_path(), 'w') as outfile:
+        # json.dump already streams the encoded chunks to the file, use a large buffer so those chunks are written to
+        # disk in a few big writes rather than many small ones
+        with open(self.json_export_path(), 'w', buffering=JSON_WRITE_BUFFER_SIZE) as outfile:
             json.dump(config, outfile, sort_keys=0, indent=4, separators=(",", ":"))
 
-    def fbx_export(self):
+    def _fbx_export(self, root_joint):
         """
-        Exports baked poses to FBX
+        Exports baked poses to FBX, expects the poses to already be named
         """
 
-        self.node().name_unnamed_poses()
-
-        self.bake_poses()
-        cmds.select(self.root_joint())
+        self.bake_poses(root_joint)
+        cmds.select(root_joint)
         fbx_export(self.fbx_export_path(),
                    animation=True,
                    bake_complex_animation=True,
@@ -122,12 +226,7 @@ class RBFNodeExporter(object):
 
         driven_attributes = self._node.driven_attributes(type='blendShape')
 
-        blendshape_nodes = list()
-        for output in driven_attributes:
-            for attribute in output:
-                blendshape_nodes.append(attribute.split('.')[0])
-
-        return list(set(blendshape_nodes))
+        return list({attribute.split('.', 1)[0] for output in driven_attributes for attribute in output})
 
     def meshes(self):
         """
@@ -138,11 +237,9 @@ class RBFNodeExporter(object):
 
         blendShapes = self.blendshape_nodes()
         if blendShapes:
-            for blendShape in blendShapes:
-                meshes.extend(cmds.deformer(blendShape, q=True, geometry=True))
-
-            meshes = list(set(meshes))
-            meshes = cmds.listRelatives(meshes, parent=True)
+            meshes = {mesh for blendShape in blendShapes
+                      for mesh in cmds.deformer(blendShape, q=True, geometry=True) or []}
+            meshes = cmds.listRelatives(list(meshes), parent=True)
 
         return meshes
 
@@ -153,20 +250,27 @@ class RBFNodeExporter(object):
 
         meshes = self.meshes()
         if meshes:
-            skeleton = list()
+            skeleton = set()
+            # find every skinCluster with a single history traversal. Prune the DAG objects so only the deformers
+            # directly on the meshes are returned, not ones on wrap drivers or blendshape target meshes
+            skin_clusters = cmds.ls(cmds.listHistory(meshes, pruneDagObjects=True) or [], type='skinCluster')
+            # find the meshes that own the skinClusters so each mesh without one can still be warned about
+            skinned_shapes = [shape for skin_cluster in skin_clusters
+                              for shape in cmds.skinCluster(skin_cluster, q=True, geometry=True) or []]
+            skinned_meshes = set()
+            if skinned_shapes:
+                skinned_meshes.update(cmds.listRelatives(skinned_shapes, parent=True, fullPath=True) or [])
             for mesh in meshes:
-                skin_cluster = cmds.ls(cmds.findDeformers(mesh), type='skinCluster')
-                if skin_cluster:
-                    skin_cluster = skin_cluster[0]
-                    influences = cmds.skinCluster(skin_cluster, q=True, inf=True)
-                    if influences:
-                        skeleton.extend(influences)
-                    else:
-                        raise RuntimeError('No influences found for "{}"'.format(skin_cluster))
-                else:
+                if not set(cmds.ls(mesh, long=True)) & skinned_meshes:
                     cmds.warning('No skinCluster found for "{}"'.format(mesh))
+            for skin_cluster in skin_clusters:
+                influences = cmds.skinCluster(skin_cluster, q=True, inf=True)
+                if influences:
+                    skeleton.update(influences)
+                else:
+                    raise RuntimeError('No influences found for "{}"'.format(skin_cluster))
 
-            root_joints = find_top_joints(skeleton)
+            root_joints = find_top_joints(list(skeleton))
 
         else:
             skeleton = self._node.drivers()
@@ -188,83 +292,117 @@ class RBFNodeExporter(object):
         """
 
         pose_root_attributes = dict()
+        # every unique attribute name driven by any pose
+        targets = set()
 
-        poses = self._node.poses()
-        for pose in poses:
-            driven_attributes = self._node.pose_driven_attributes(pose)  # add type flag!
+        # bind the lookup once, it is called for every pose
+        pose_driven_attributes = self._node.pose_driven_attributes
+
+        # phase 1: gather the root attributes for each pose without touching the scene
+        for pose in self._node.poses():
             current_pose = list()
-            for attribute in driven_attributes:
-                node, target = attribute.split('.')
+            for attribute in pose_driven_attributes(pose):  # add type flag!
+                target = attribute.split('.', 1)[1]
                 root_attribute = '{}.{}'.format(root_joint, target)
                 if root_attribute not in current_pose:
-                    if not cmds.objExists(root_attribute):
-                        cmds.addAttr(root_joint, ln=target, at='double', k=True)
-                    else:
-                        input_connection = cmds.listConnections(root_attribute, s=True, d=False, plugs=True)
-                        if input_connection:
-                            cmds.disconnectAttr(input_connection[0], root_attribute)
-
                     # cmds.connectAttr(attribute, root_attribute)
                     current_pose.append(root_attribute)
+                    targets.add(target)
 
             pose_root_attributes[pose] = current_pose
 
+        # phase 2: add the missing attributes and disconnect the existing ones in bulk
+        existing_targets = set(cmds.listAttr(root_joint) or []) | set(cmds.listAttr(root_joint, shortNames=True) or [])
+        for target in targets - existing_targets:
+            cmds.addAttr(root_joint, ln=target, at='double', k=True)
+
+        existing_attributes = ['{}.{}'.format(root_joint, target) for target in targets & existing_targets]
+        if existing_attributes:
+            # returns pairs of (root attribute, input connection) for every connected root attribute
+            input_connections = cmds.listConnections(existing_attributes, s=True, d=False, plugs=True,
+                                                     connections=True) or []
+            for i in range(0, len(input_connections), 2):
+                cmds.disconnectAttr(input_connections[i + 1], input_connections[i])
+
         return pose_root_attributes
 
-    def bake_poses(self):
+    def bake_poses(self, root_joint=None):
         """
         Bakes the RBFNode poses in the timeline for FBX export
         """
 
-        for anim_curve_type in ['animCurveTL', 'animCurveTA', 'animCurveTU']:
-            cmds.delete(cmds.ls(type=anim_curve_type))
-
-        pose_root_attributes = self.add_root_attributes(self.root_joint())
-
-        for frame, pose in enumerate(self._node.poses()):
-
-            # go to pose
-            self._node.go_to_pose(pose)
-
-            # key controllers
-            if self._node.num_controllers():
-                for controller in self._node.controllers():
-                    cmds.setKeyframe(controller, t=frame, inTangentType='linear', outTangentType='step')
-
-            # or key drivers
-            else:
-                for driver in self._node.drivers():
-                    cmds.setKeyframe(driver, t=frame, inTangentType='linear', outTangentType='step')
-
-            root_attributes = pose_root_attributes.get(pose, [])
+        if root_joint is None:
+            root_joint = self.root_joint()
 
-            for root_attribute in root_attributes:
-
-                input_connection = cmds.listConnections(root_attribute, s=True, d=False, plugs=True)
-                if input_connection:
-                    cmds.disconnectAttr(input_connection[0], root_attribute)
+        # query the node once up front, none of these change whilst baking
+        node = self._node
+        poses = list(node.poses())
+        end_frame = len(poses) - 1
+        # key controllers if there are any, otherwise key drivers
+        if node.num_controllers():
+            keyed_transforms = list(node.controllers() or [])
+        else:
+            keyed_transforms = list(node.drivers() or [])
+        # bind the commands used every frame to locals
+        go_to_pose = node.go_to_pose
+        set_keyframe = cmds.setKeyframe
+        set_attr = cmds.setAttr
+
+        with _suspend_viewport_and_dg():
+            # only clear the curves driving the nodes that are about to be keyed, not every curve in the scene. Only
+            # time based curves are removed, unitless input curves are set driven keys that belong to the rig
+            anim_curves = cmds.listConnections(keyed_transforms + [root_joint], s=True, d=False,
+                                               type='animCurve') or []
+            anim_curves = cmds.ls(list(set(anim_curves)), type=['animCurveTL', 'animCurveTA', 'animCurveTU']) or []
+            if anim_curves:
+                cmds.delete(anim_curves)
+
+            # every root attribute is added or disconnected here, so the poses can be keyed without checking them again
+            pose_root_attributes = self.add_root_attributes(root_joint)
+
+            for frame, pose in enumerate(poses):
+
+                # go to pose
+                go_to_pose(pose)
+
+                # key controllers or drivers, tangents are set for every key once baking is done. An empty list would
+                # key the active selection instead
+                if keyed_transforms:
+                    set_keyframe(keyed_transforms, t=frame)
+
+                root_attributes = pose_root_attributes.get(pose, [])
+                if not root_attributes:
+                    continue
 
                 # Key Driven Before/After
-                cmds.setAttr(root_attribute, 0)
+                for root_attribute in root_attributes:
+                    set_attr(root_attribute, 0)
 
-                if frame == len(self._node.poses()) - 1:
-                    cmds.setKeyframe(root_attribute, t=(frame - 1), inTangentType='linear', outTangentType='linear')
+                if frame == end_frame:
+                    neighbour_frames = (frame - 1)
                 else:
-                    cmds.setKeyframe(root_attribute, t=((frame - 1), (frame + 1)), inTangentType='linear',
-                                     outTangentType='linear')
+                    neighbour_frames = ((frame - 1), (frame + 1))
+                set_keyframe(root_attributes, t=neighbour_frames)
 
                 # Key Driven
-                cmds.setAttr(root_attribute, 1)
-                cmds.setKeyframe(root_attribute, t=frame, inTangentType='linear', outTangentType='linear')
+                for root_attribute in root_attributes:
+                    set_attr(root_attribute, 1)
+                set_keyframe(root_attributes, t=frame)
+
+            # set the tangents for all the baked keys in one pass per group
+            if poses and keyed_transforms:
+                cmds.keyTangent(keyed_transforms, itt='linear', ott='step')
+            keyed_root_attributes = sorted(set(attr for attrs in pose_root_attributes.values() for attr in attrs))
+            if keyed_root_attributes:
+                cmds.keyTangent(keyed_root_attributes, itt='linear', ott='linear')
 
         # set start-end frames
-        end_frame = len(self._node.poses()) - 1
         cmds.playbackOptions(minTime=0, maxTime=end_frame, animationStartTime=0, animationEndTime=end_frame)
         cmds.dgdirty(a=True)
 
 
 class RBFPoseExporterBatch(object):
-    """
+    r"""
     Utility class to export multiple RBFsolver nodes, exports a JSON and FBX for each solver
 
     >>> solvers = cmds.ls(type='UE4RBFSolverNode')
@@ -297,13 +435,14 @@ class RBFPoseExporterBatch(object):
         if not hasattr(nodes, '__iter__'):
             nodes = [nodes]
 
-        exporters = list()
-        for node in nodes:
-            if cmds.objectType(node, isAType=RBFNodeExporter.node_type):
-                exporters.append(RBFNodeExporter(node, asset_name, export_directory))
+        # filter every node by type in a single query
+        exporters = [
+            RBFNodeExporter(node, asset_name, export_directory)
+            for node in cmds.ls(nodes, type=RBFNode.node_type) or []
+        ]
 
         if not len(exporters):
-            raise RuntimeError('No valid {} objects found'.format(RBFNodeExporter.node_type))
+            raise RuntimeError('No valid {} objects found'.format(RBFNode.node_type))
 
         self._poseExporter = exporters
         self._asset_name = asset_name
@@ -320,8 +459,47 @@ class RBFPoseExporterBatch(object):
 
     # -------------------------------------------------------------------------------------
 
-    def export(self, run_in_subprocess=True):
-        # TO-DO: Implement run_in_subprocess
-        for exporter in self.pose_exporter():
-            cmds.file(self.rig_scene(), open=True, force=True)
-            exporter.export()
+    def export(self, run_in_subprocess=False, max_processes=2):
+        """
+        Exports every solver from a clean copy of the rig scene. When run_in_subprocess is True the solvers are
+        exported in parallel, each in its own mayapy process. Every process opens the full rig scene and takes a
+        batch licence, so the number running at once is capped by max_processes
+        :param run_in_subprocess :type bool: export the solvers in separate mayapy processes
+        :param max_processes :type int: maximum number of mayapy processes to run at once
+        """
+
+        exporters = self.pose_exporter()
+        if not exporters:
+            return
+
+        mayapy = _mayapy_path() if run_in_subprocess else None
+        if run_in_subprocess and mayapy is None:
+            cmds.warning('Unable to find mayapy from MAYA_LOCATION, exporting the solvers in this session')
+
+        if mayapy is None:
+            for exporter in exporters:
+                cmds.file(self.rig_scene(), open=True, force=True)
+                exporter.export()
+            return
+
+        nodes = [str(exporter.node()) for exporter in exporters]
+        # the work happens in the mayapy processes, threads are only used to wait on them
+        pool = ThreadPool(processes=max(1, min(len(nodes), max_processes, multiprocessing.cpu_count())))
+        try:
+            results = pool.map(
+                lambda node: _export_in_subprocess(
+                    mayapy, self.rig_scene(), node, self.asset_name(), self.export_directory()
+                ),
+                nodes
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        failed = []
+        for node, return_code, output in results:
+            if return_code:
+                cmds.warning('Export failed for "{}":\n{}'.format(node, output))
+                failed.append(node)
+        if failed:
+            raise RuntimeError('Unable to export {}'.format(failed))
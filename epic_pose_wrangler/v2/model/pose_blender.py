@@ -1,6 +1,7 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
 
-import copy
+import contextlib
+import weakref
 
 from maya import cmds
 from maya.api import OpenMaya as om
@@ -9,11 +10,25 @@ from epic_pose_wrangler.log import LOG
 from epic_pose_wrangler.v2.model import exceptions, utils
 
 
+def _on_attribute_changed(message, plug, other_plug, wrapper_ref):
+    """
+    MNodeMessage callback that clears a wrapper's cached edit state when the connections that define it change
+    :param wrapper_ref :type weakref.ref: reference to the UEPoseBlenderNode, weak so the callback doesn't keep it alive
+    """
+    if not message & (om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken):
+        return
+    wrapper = wrapper_ref()
+    if wrapper is not None and plug.partialName(useLongNames=True) in ('outMatrix', 'drivenTransform'):
+        wrapper._edit_state = None
+
+
 class UEPoseBlenderNode(object):
     """
     Class wrapper for UEPoseBlenderNode
     """
     node_type = 'UEPoseBlenderNode'
+    # Live wrappers keyed by class and MObject hash, so wrapping the same node again returns the same instance
+    _instances = weakref.WeakValueDictionary()
 
     @classmethod
     def create(cls, driven_transform=None):
@@ -45,7 +60,15 @@ class UEPoseBlenderNode(object):
         """
         Returns all PoseBlender nodes in scene
         """
-        return [cls(node) for node in cmds.ls(type=cls.node_type)]
+        return list(cls.iter_all())
+
+    @classmethod
+    def iter_all(cls):
+        """
+        Yields the PoseBlender nodes in scene one at a time, so callers that stop early only wrap the nodes they visit
+        """
+        for node in cmds.ls(type=cls.node_type) or []:
+            yield cls(node)
 
     @classmethod
     def find_by_name(cls, name):
@@ -73,7 +96,29 @@ class UEPoseBlenderNode(object):
             return
         return cls(connections[0])
 
+    def __new__(cls, node):
+        """
+        Returns the existing wrapper for the node if there is one, otherwise creates a new one
+        """
+        try:
+            mobject = om.MGlobal.getSelectionListByName(node).getDependNode(0)
+        except (RuntimeError, TypeError):
+            # Let __init__ raise the InvalidNodeType error
+            return super(UEPoseBlenderNode, cls).__new__(cls)
+        key = (cls, om.MObjectHandle(mobject).hashCode())
+        instance = cls._instances.get(key)
+        # Check the cached wrapper is for this node, the hash could belong to a node that has since been deleted
+        if instance is not None and instance._node.object() == mobject:
+            return instance
+        instance = super(UEPoseBlenderNode, cls).__new__(cls)
+        instance._hash = key[1]
+        cls._instances[key] = instance
+        return instance
+
     def __init__(self, node):
+        # Wrappers are shared between callers, don't reset the state of one that is already set up
+        if getattr(self, '_node', None) is not None:
+            return
         # If the node doesn't exist, raise an exception
         if not cmds.objectType(node, isAType=self.node_type):
             raise exceptions.InvalidNodeType(
@@ -84,6 +129,29 @@ class UEPoseBlenderNode(object):
             )
         # Store a reference ot the MObject in case the name of the node is changed whilst this class is still in use
         self._node = om.MFnDependencyNode(om.MGlobal.getSelectionListByName(node).getDependNode(0))
+        # Query results stored whilst inside a _cache context, None when no context is active
+        self._cache_data = None
+        # Attribute existence checks, the attributes on this node don't change once it is created
+        self._has_attr_cache = {}
+        # Resolved plugs by attribute name, stay valid for as long as the node exists
+        self._plugs = {}
+        # Cached result of the edit getter, cleared when the outMatrix or drivenTransform connections change
+        self._edit_state = None
+        self._callback_id = om.MNodeMessage.addAttributeChangedCallback(
+            self._node.object(), _on_attribute_changed, weakref.ref(self)
+        )
+
+    def __del__(self):
+        """
+        Remove the attribute changed callback when the wrapper is garbage collected
+        """
+        callback_id = getattr(self, '_callback_id', None)
+        if callback_id is not None:
+            try:
+                om.MMessage.removeCallback(callback_id)
+            except RuntimeError:
+                # The callback is removed by Maya when the node is deleted
+                pass
 
     def __repr__(self):
         """
@@ -102,8 +170,20 @@ class UEPoseBlenderNode(object):
         Returns if two objects are the same, allows for comparing two different UEPoseBlenderNode references that wrap
         the same MObject
         """
+        if isinstance(other, UEPoseBlenderNode):
+            # Wrappers are shared per node, so this is normally an identity check. Otherwise different hash codes
+            # reject without touching the API, matching ones are confirmed against the MObjects
+            if self is other:
+                return True
+            return self._hash == other._hash and self._node.object() == other._node.object()
         return str(self) == str(other)
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return self._hash
+
     def __enter__(self):
         """
         Override the __enter__ to allow for this class to be used as a context manager to toggle edit mode
@@ -119,7 +199,63 @@ class UEPoseBlenderNode(object):
         """
         On exit, disable edit mode
         """
-        self.edit = not self.edit
+        with self._cache():
+            self.edit = not self.edit
+
+    @contextlib.contextmanager
+    def _cache(self):
+        """
+        Context manager that memoizes connection queries (driven_transform, rbf_solver) until it exits.
+        Can be safely nested, the cache is cleared when the outermost context exits
+        """
+        if self._cache_data is not None:
+            yield
+            return
+        self._cache_data = {}
+        try:
+            yield
+        finally:
+            self._cache_data = None
+
+    def _cached(self, key, query):
+        """
+        Returns the cached result for the key if a _cache context is active, otherwise runs the query
+        :param key :type str: cache key
+        :param query :type callable: function to call when there is no cached result
+        """
+        if self._cache_data is None:
+            return query()
+        if key not in self._cache_data:
+            self._cache_data[key] = query()
+        return self._cache_data[key]
+
+    def _uncache(self, *keys):
+        """
+        Removes the specified keys from the active cache, called when the DG state they describe changes
+        """
+        if self._cache_data is not None:
+            for key in keys:
+                self._cache_data.pop(key, None)
+
+    def _has_attr(self, attr_name):
+        """
+        Returns if this node has the specified attribute, the result is cached per instance
+        :param attr_name :type str: name of the attribute
+        :return :type bool:
+        """
+        if attr_name not in self._has_attr_cache:
+            self._has_attr_cache[attr_name] = self._node.hasAttribute(attr_name)
+        return self._has_attr_cache[attr_name]
+
+    def _plug(self, attr_name):
+        """
+        Returns the plug for one of this node's attributes, resolving it the first time it is requested
+        :param attr_name :type str: name of the attribute i.e poses
+        :return :type om.MPlug:
+        """
+        if attr_name not in self._plugs:
+            self._plugs[attr_name] = self._node.findPlug(attr_name, False)
+        return self._plugs[attr_name]
 
     @property
     def node(self):
@@ -159,7 +295,14 @@ class UEPoseBlenderNode(object):
         Get the current driven transform
         :return :type str: transform node name
         """
-        if cmds.attributeQuery('drivenTransform', node=self.node, exists=True):
+        return self._cached('driven_transform', self._get_driven_transform)
+
+    def _get_driven_transform(self):
+        """
+        Queries the driven transform connected to this node
+        :return :type str: transform node name
+        """
+        if self._has_attr('drivenTransform'):
             transforms = cmds.listConnections("{node}.drivenTransform".format(node=self.node))
             if transforms:
                 return transforms[0]
@@ -169,6 +312,15 @@ class UEPoseBlenderNode(object):
         """
         :return :type bool: are the driven transforms connected to this node editable?
         """
+        if self._edit_state is None:
+            self._edit_state = self._get_edit()
+        return self._edit_state
+
+    def _get_edit(self):
+        """
+        Queries if the driven transforms connected to this node are editable
+        :return :type bool:
+        """
         transform = self.driven_transform
         # If no transform, we can edit!
         if not transform:
@@ -198,13 +350,21 @@ class UEPoseBlenderNode(object):
         """
         :return:The connected rbf solver node if it exists
         """
+        return self._cached('rbf_solver', self._get_rbf_solver)
+
+    def _get_rbf_solver(self):
+        """
+        Queries the connected rbf solver node
+        :return :type api.RBFNode or None:
+        """
         from epic_pose_wrangler.v2.model import api
         # Check the attr exists
-        exists = cmds.attributeQuery(self.rbf_solver_attr.split('.')[-1], node=self.node, exists=True)
+        if not self._has_attr('rbfSolver'):
+            return None
         # Query the connections
         connections = cmds.listConnections(self.rbf_solver_attr)
-        # Return the node if the attr exists and a connection is found
-        return api.RBFNode(connections[0]) if exists and connections else None
+        # Return the node if a connection is found
+        return api.RBFNode(connections[0]) if connections else None
 
     @rbf_solver.setter
     def rbf_solver(self, rbf_solver_attr):
@@ -213,6 +373,7 @@ class UEPoseBlenderNode(object):
         :param rbf_solver_attr: the attribute on the rbf solver to connect this to i.e my_rbf_solver.poseBlend_back_120
         """
         utils.message_connect(rbf_solver_attr, self.rbf_solver_attr)
+        self._uncache('rbf_solver')
 
     @property
     def base_pose(self):
@@ -248,8 +409,9 @@ class UEPoseBlenderNode(object):
         :param value: float, int or string (i.e node.attributeName). Float/Int will set the value, whilst
         passing an attribute will connect the plugs
         """
-        if isinstance(value, float) or isinstance(value, int) and 0 > value > 1:
-            value = min(max(0.0, value), 1.0)
+        # Clamp numeric values to the 0-1 range, attribute names are connected as-is
+        if isinstance(value, (int, float)):
+            value = min(max(0.0, float(value)), 1.0)
         utils.set_attr_or_connect(source_attr_name=self.envelope_attr, value=value)
 
     @property
@@ -282,41 +444,66 @@ class UEPoseBlenderNode(object):
         Connect the output matrix up to a given transform node
         :param transform_name: name of a transform node to connect to
         """
-        # If a transform is specified, connect it
-        current_selection = cmds.ls(selection=True)
-        if transform_name:
-            # Check that the node type is a transform
-            if not cmds.ls(transform_name, type='transform'):
-                # If its not a transform raise an error
-                raise exceptions.InvalidNodeType(
-                    "Invalid node type. Expected 'transform', received '{node_type}'".format(
-                        node_type=cmds.objectType(transform_name)
-                    )
-                )
-            # Create a new decomposeMatrix node to convert the outMatrix to T,R,S
-            mx_decompose_node = cmds.createNode('decomposeMatrix', name="{node}_mx_decompose#".format(node=self.node))
-            # Connect the outMatrix up to the decomposeMatrix's input
-            cmds.connectAttr(self.out_matrix_attr, '{node}.inputMatrix'.format(node=mx_decompose_node))
-            # Create an iterator with TRS attributes
-            attributes = ('translate', 'rotate', 'scale')
-            # Iterate through each attr and connect it
-            for attr in attributes:
-                out_attr = '{mx_decompose_node}.output{attr}'.format(
-                    mx_decompose_node=mx_decompose_node,
-                    attr=attr.capitalize()
+        # Get the attribute name once, it is used throughout
+        out_matrix_attr = self.out_matrix_attr
+        # Check that the node type is a transform
+        if transform_name and not cmds.ls(transform_name, type='transform'):
+            # If its not a transform raise an error
+            raise exceptions.InvalidNodeType(
+                "Invalid node type. Expected 'transform', received '{node_type}'".format(
+                    node_type=cmds.objectType(transform_name)
                 )
-                in_attr = '{node_name}.{attr}'.format(node_name=transform_name, attr=attr)
-                cmds.connectAttr(out_attr, in_attr, force=True)
-        else:
-            # No transform was specified, disconnect all existing connections
-            connections = cmds.listConnections(self.out_matrix_attr, type='decomposeMatrix')
-            current_matrix = cmds.xform(self.driven_transform, query=True, matrix=True, objectSpace=True)
-            if connections:
-                cmds.delete(connections)
-            for connection in cmds.listConnections(self.out_matrix_attr, plugs=True) or []:
-                cmds.disconnectAttr(self.out_matrix_attr, connection)
-            cmds.xform(self.driven_transform, matrix=current_matrix, objectSpace=True)
-        cmds.select(current_selection, replace=True)
+            )
+        # Store the selection through the API, cmds.ls(selection=True) can be slow in large scenes
+        current_selection = om.MGlobal.getActiveSelectionList()
+        # Group the edits into a single undo step and don't redraw the viewport for each of them
+        cmds.undoInfo(openChunk=True, undoName='set pose blender outMatrix')
+        try:
+            with utils.suspend_refresh(), utils.suspend_evaluation():
+                # If a transform is specified, connect it
+                if transform_name:
+                    # Create a new decomposeMatrix node to convert the outMatrix to T,R,S
+                    mx_decompose_node = cmds.createNode(
+                        'decomposeMatrix',
+                        name="{node}_mx_decompose#".format(node=out_matrix_attr.split('.')[0])
+                    )
+                    # Connect the outMatrix up to the decomposeMatrix's input
+                    cmds.connectAttr(out_matrix_attr, '{node}.inputMatrix'.format(node=mx_decompose_node))
+                    # Create an iterator with TRS attributes
+                    attributes = ('translate', 'rotate', 'scale')
+                    # Iterate through each attr and connect it
+                    for attr in attributes:
+                        out_attr = '{mx_decompose_node}.output{attr}'.format(
+                            mx_decompose_node=mx_decompose_node,
+                            attr=attr.capitalize()
+                        )
+                        in_attr = '{node_name}.{attr}'.format(node_name=transform_name, attr=attr)
+                        cmds.connectAttr(out_attr, in_attr, force=True)
+                else:
+                    # No transform was specified, disconnect all existing connections
+                    connections = cmds.listConnections(out_matrix_attr, type='decomposeMatrix')
+                    driven_transform = self.driven_transform
+                    current_matrix = cmds.xform(driven_transform, query=True, matrix=True, objectSpace=True)
+                    if connections:
+                        cmds.delete(connections)
+                    for connection in cmds.listConnections(out_matrix_attr, plugs=True) or []:
+                        cmds.disconnectAttr(out_matrix_attr, connection)
+                    cmds.xform(driven_transform, matrix=current_matrix, objectSpace=True)
+                # Only restore the selection if creating/deleting nodes changed it
+                if om.MGlobal.getActiveSelectionList().getSelectionStrings() != current_selection.getSelectionStrings():
+                    om.MGlobal.setActiveSelectionList(current_selection)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        # The outMatrix connections define the edit state
+        self._edit_state = None
+
+    def _num_elements(self, attr_name):
+        """
+        Get the number of elements in one of this node's array attributes without building a list of the indices
+        :param attr_name :type str: name of the array attribute i.e poses
+        :return :type int: number of elements
+        """
+        return self._plug(attr_name).evaluateNumElements()
 
     def get_pose(self, index=-1):
         """
@@ -324,6 +511,10 @@ class UEPoseBlenderNode(object):
         :param index :type int: index to query
         :return :type list matrix or None
         """
+        if index >= 0:
+            # Read the matrix straight from the element plug
+            plug = self._plug('poses').elementByLogicalIndex(index)
+            return list(om.MFnMatrixData(plug.asMObject()).matrix())
         # Get the value of the pose_attr at the specified index
         return utils.get_attr(
             '{poses_attr}[{index}]'.format(poses_attr=self.poses_attr, index=index),
@@ -335,7 +526,7 @@ class UEPoseBlenderNode(object):
         :return :type list of matrices
         """
         # TODO update this when the weight + name get added
-        return utils.get_attr_array(attr_name=self.poses_attr, as_value=True)
+        return utils.get_matrix_array(self.poses_attr)
 
     def add_pose_from_current(self, pose_name, index=-1):
         """
@@ -346,7 +537,7 @@ class UEPoseBlenderNode(object):
         # Find the next index if no index is specified
         if index < 0:
             # If the index is less than 0 find the next available index
-            index = len(cmds.getAttr(self.poses_attr, multiIndices=True) or [0]) - 1
+            index = max(self._num_elements('poses'), 1) - 1
         # Store driven transform in var to reduce number of cmds calls
         driven_transform = self.driven_transform
         if not driven_transform:
@@ -374,7 +565,7 @@ class UEPoseBlenderNode(object):
                 return
             else:
                 # If the index is less than 0 find the next available index
-                index = len(cmds.getAttr(self.poses_attr, multiIndices=True) or [0]) - 1
+                index = max(self._num_elements('poses'), 1) - 1
 
         # If no matrix is specified, grab the matrix for the driven transform
         if matrix is None:
@@ -382,7 +573,7 @@ class UEPoseBlenderNode(object):
 
         # TODO add in support for inserting into the pose list
         if not overwrite:
-            pose_count = len(cmds.getAttr(self.poses_attr, multiIndices=True) or [])
+            pose_count = self._num_elements('poses')
             if pose_count - 1 > index:
                 pass
 
@@ -414,20 +605,31 @@ class UEPoseBlenderNode(object):
         if index < 0 and not pose_name:
             raise exceptions.InvalidPoseIndex("Unable to delete pose")
 
-        # Copy a list of the poses
-        poses = copy.deepcopy(self.get_poses())
-
-        # Iterate through the existing poses in reverse
-        for i in reversed(range(len(poses))):
-            # Remove the pose from the list of targets
-            cmds.removeMultiInstance('{blender}.poses[{index}]'.format(blender=self, index=i), b=True)
-
-        # Remove the pose at the given index
-        poses.pop(index)
-
-        # Re-add all the deleted poses (minus the one we popped)
-        for pose_index, matrix in enumerate(poses):
-            self.set_pose(index=pose_index, matrix=matrix)
+        # get_poses builds a new list and the matrices are only read, so it can be modified without copying
+        poses = self.get_poses()
+        # Resolve a negative index to the pose it refers to
+        if index < 0:
+            index += len(poses)
+
+        # Get the attribute name once rather than for every pose
+        poses_attr = self.poses_attr
+        # Group the edits into a single undo step and don't redraw the viewport for every one of them
+        cmds.undoInfo(openChunk=True, undoName='delete pose')
+        try:
+            with utils.suspend_refresh(), utils.suspend_evaluation():
+                # Iterate through the poses from the deleted index onwards in reverse, the ones before it don't move
+                for i in reversed(range(index, len(poses))):
+                    # Remove the pose from the list of targets
+                    cmds.removeMultiInstance('{poses_attr}[{index}]'.format(poses_attr=poses_attr, index=i), b=True)
+
+                # Remove the pose at the given index
+                poses.pop(index)
+
+                # Re-add the poses that came after the deleted one, shifted down by one
+                for pose_index in range(index, len(poses)):
+                    self.set_pose(index=pose_index, matrix=poses[pose_index])
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
     def get_weight(self, index, as_float=True):
         """
@@ -436,6 +638,9 @@ class UEPoseBlenderNode(object):
         :param as_float :type bool: return as float or as attribute name of the connected plug
         :return: float or plug
         """
+        if as_float and index >= 0:
+            # Read the value straight from the element plug
+            return self._plug('weights').elementByLogicalIndex(index).asFloat()
         return utils.get_attr('{weights}[{index}]'.format(weights=self.weights_attr, index=index), as_value=as_float)
 
     def get_weights(self, as_float=True):
@@ -455,7 +660,7 @@ class UEPoseBlenderNode(object):
         """
         if index < 0:
             # If the index is less than 0 find the next available index
-            index = len(cmds.getAttr(self.weights_attr, multiIndices=True) or [0]) - 1
+            index = max(self._num_elements('weights'), 1) - 1
         # Generate the correct source attr name for the index specified
         source_attr_name = '{weights}[{index}]'.format(weights=self.weights_attr, index=index)
         # Set the array element to either the attr or the float value
@@ -467,36 +672,58 @@ class UEPoseBlenderNode(object):
         :param in_float_array_attr :type str: node.attributeName array attribute to connect all indices with
         :param floats :type list: list of float values to set for each corresponding index
         """
+        # Get the attribute name once rather than for every index
+        weights_attr = self.weights_attr
         # Prioritize plugs over setting floats
         if in_float_array_attr:
-            # Iterate through all the indices in the array
-            for i in range(len(cmds.getAttr(in_float_array_attr, multiIndices=True) or [0])):
-                # Generate the source attr name
-                in_float_attr = "{array_attr}[{index}]".format(array_attr=in_float_array_attr, index=i)
-                # Set the weight for the current index
-                self.set_weight(index=i, in_float_attr=in_float_attr)
+            # Build every connection up front, the number of indices is only queried once
+            connections = [
+                ("{array_attr}[{index}]".format(array_attr=in_float_array_attr, index=i),
+                 '{weights}[{index}]'.format(weights=weights_attr, index=i))
+                for i in range(len(cmds.getAttr(in_float_array_attr, multiIndices=True) or [0]))
+            ]
+            # Make all the connections as a single undo step without redrawing or re-evaluating for each one
+            cmds.undoInfo(openChunk=True, undoName='set weights')
+            try:
+                with utils.suspend_refresh(), utils.suspend_evaluation():
+                    for in_float_attr, weight_attr in connections:
+                        # Connect the weight for the current index
+                        utils.set_attr_or_connect(source_attr_name=weight_attr, value=in_float_attr)
+            finally:
+                cmds.undoInfo(closeChunk=True)
         elif floats:
-            # Iterate through the floats
-            for index, float_value in enumerate(floats):
-                # Set the weight for the current index
-                self.set_weight(index=index, float_value=float_value)
+            # Set every weight with a single ranged setAttr
+            cmds.setAttr(
+                '{weights}[0:{last_index}]'.format(weights=weights_attr, last_index=len(floats) - 1),
+                *floats
+            )
 
     def delete(self):
         """
         Delete the node associated with this wrapper
         """
-        # If we aren't in edit mode we still have connections made to decomposeMatrix nodes that we want to delete
-        if not self.edit:
-            # Enable edit mode to delete those decomposeMatrix nodes
-            self.edit = True
-        # Disconnect all attrs
-        destination_conns = cmds.listConnections(self, plugs=True, connections=True, source=False) or []
-        for i in range(0, len(destination_conns), 2):
-            cmds.disconnectAttr(destination_conns[i], destination_conns[i + 1])
-        source_conns = cmds.listConnections(self, plugs=True, connections=True, destination=False) or []
-
-        for i in range(0, len(source_conns), 2):
-            # we have to flip these because the output is always node centric and not connection centric
-            cmds.disconnectAttr(source_conns[i + 1], source_conns[i])
-        # Delete the node
-        cmds.delete(self.node)
+        # Group the whole delete into a single undo step and don't redraw the viewport for every disconnect
+        cmds.undoInfo(openChunk=True, undoName='delete pose blender')
+        try:
+            with utils.suspend_refresh():
+                # Query the driven transform once for the edit getter, setter and outMatrix disconnect
+                with self._cache():
+                    # If we aren't in edit mode we still have connections made to decomposeMatrix nodes that we want
+                    # to delete
+                    if not self.edit:
+                        # Enable edit mode to delete those decomposeMatrix nodes
+                        self.edit = True
+                node = self.node
+                # Disconnect all attrs
+                destination_conns = cmds.listConnections(node, plugs=True, connections=True, source=False) or []
+                for i in range(0, len(destination_conns), 2):
+                    cmds.disconnectAttr(destination_conns[i], destination_conns[i + 1])
+                source_conns = cmds.listConnections(node, plugs=True, connections=True, destination=False) or []
+
+                for i in range(0, len(source_conns), 2):
+                    # we have to flip these because the output is always node centric and not connection centric
+                    cmds.disconnectAttr(source_conns[i + 1], source_conns[i])
+                # Delete the node
+                cmds.delete(node)
+        finally:
+            cmds.undoInfo(closeChunk=True)
@@ -2,51 +2,76 @@
 import math
 import traceback
 
-from maya import OpenMaya, cmds
+from maya import cmds
+from maya.api import OpenMaya as om
 
 from epic_pose_wrangler.log import LOG
+# The suspend contexts are shared with v1, they are imported here so existing callers can keep using utils
+from epic_pose_wrangler.model.utils import suspend_evaluation, suspend_refresh
 from epic_pose_wrangler.v2.model import exceptions
 
-# NOTE: MTransformationMatrix & MEulerRotation have different values for the same axis.
-XFORM_ROTATION_ORDER = {
-    'xyz': OpenMaya.MTransformationMatrix.kXYZ,
-    'yzx': OpenMaya.MTransformationMatrix.kYZX,
-    'zxy': OpenMaya.MTransformationMatrix.kZXY,
-    'xzy': OpenMaya.MTransformationMatrix.kXZY,
-    'yxz': OpenMaya.MTransformationMatrix.kYXZ,
-    'zyx': OpenMaya.MTransformationMatrix.kZYX
-}
-
 EULER_ROTATION_ORDER = {
-    'xyz': OpenMaya.MEulerRotation.kXYZ,
-    'yzx': OpenMaya.MEulerRotation.kYZX,
-    'zxy': OpenMaya.MEulerRotation.kZXY,
-    'xzy': OpenMaya.MEulerRotation.kXZY,
-    'yxz': OpenMaya.MEulerRotation.kYXZ,
-    'zyx': OpenMaya.MEulerRotation.kZYX
+    'xyz': om.MEulerRotation.kXYZ,
+    'yzx': om.MEulerRotation.kYZX,
+    'zxy': om.MEulerRotation.kZXY,
+    'xzy': om.MEulerRotation.kXZY,
+    'yxz': om.MEulerRotation.kYXZ,
+    'zyx': om.MEulerRotation.kZYX
 }
 
+# Maximum number of results kept by each of the compose_matrix/decompose_matrix caches before they are cleared
+TRANSFORM_CACHE_SIZE = 4096
+_COMPOSE_MATRIX_CACHE = {}
+_DECOMPOSE_MATRIX_CACHE = {}
+
+
+def clear_transform_caches():
+    """
+    Clears the compose_matrix and decompose_matrix result caches
+    """
+    _COMPOSE_MATRIX_CACHE.clear()
+    _DECOMPOSE_MATRIX_CACHE.clear()
+
 
 def compose_matrix(position, rotation, rotation_order='xyz'):
     """
-    Compose a 4x4 matrix with given transformation.
+    Compose a 4x4 matrix with given transformation. Results are cached, the same inputs recur often (default poses,
+    identity transforms)
 
     >>> compose_matrix((0.0, 0.0, 0.0), (90.0, 0.0, 0.0))
     [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]
     """
+    key = (tuple(position), tuple(rotation), rotation_order)
+    matrix = _COMPOSE_MATRIX_CACHE.get(key)
+    if matrix is None:
+        if len(_COMPOSE_MATRIX_CACHE) >= TRANSFORM_CACHE_SIZE:
+            _COMPOSE_MATRIX_CACHE.clear()
+        matrix = tuple(compose_matrices([position], [rotation], rotation_order=rotation_order)[0])
+        _COMPOSE_MATRIX_CACHE[key] = matrix
+    # Return a new list so callers can't modify the cached result
+    return list(matrix)
+
+
+def compose_matrices(positions, rotations, rotation_order='xyz'):
+    """
+    Compose a 4x4 matrix for each position and rotation pair, sharing the setup between them.
 
-    # create rotation ptr
-    rot_script_util = OpenMaya.MScriptUtil()
-    rot_script_util.createFromDouble(*[deg * math.pi / 180.0 for deg in rotation])
-    rot_double_ptr = rot_script_util.asDoublePtr()
-
-    # construct transformation matrix
-    xform_matrix = OpenMaya.MTransformationMatrix()
-    xform_matrix.setTranslation(OpenMaya.MVector(*position), OpenMaya.MSpace.kTransform)
-    xform_matrix.setRotation(rot_double_ptr, XFORM_ROTATION_ORDER[rotation_order], OpenMaya.MSpace.kTransform)
-
-    matrix = xform_matrix.asMatrix()
-    return [matrix(m, n) for m in range(4) for n in range(4)]
+    >>> compose_matrices([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)], [(90.0, 0.0, 0.0), (0.0, 0.0, 0.0)])
+    [[1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+     [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0, 1.0]]
+    """
+    euler_order = EULER_ROTATION_ORDER[rotation_order]
+    matrices = []
+    for position, rotation in zip(positions, rotations):
+        # construct transformation matrix from the rotation, then add the translation
+        xform_matrix = om.MTransformationMatrix(
+            om.MEulerRotation(
+                math.radians(rotation[0]), math.radians(rotation[1]), math.radians(rotation[2]), euler_order
+            ).asMatrix()
+        )
+        xform_matrix.setTranslation(om.MVector(position), om.MSpace.kTransform)
+        matrices.append(list(xform_matrix.asMatrix()))
+    return matrices
 
 
 def decompose_matrix(matrix, rotation_order='xyz'):
@@ -56,27 +81,39 @@ def decompose_matrix(matrix, rotation_order='xyz'):
     >>> decompose_matrix([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
     ((0.0, 0.0, 0.0), (90.0, 0.0, 0.0))
     """
+    key = (tuple(matrix), rotation_order)
+    result = _DECOMPOSE_MATRIX_CACHE.get(key)
+    if result is None:
+        if len(_DECOMPOSE_MATRIX_CACHE) >= TRANSFORM_CACHE_SIZE:
+            _DECOMPOSE_MATRIX_CACHE.clear()
+        # The result is made of tuples, so it can be returned from the cache as-is
+        result = decompose_matrices([matrix], rotation_order=rotation_order)[0]
+        _DECOMPOSE_MATRIX_CACHE[key] = result
+    return result
+
+
+def decompose_matrices(matrices, rotation_order='xyz'):
+    """
+    Decomposes each 4x4 matrix into translation and rotation, sharing the setup between them.
 
-    mmatrix = OpenMaya.MMatrix()
-    OpenMaya.MScriptUtil.createMatrixFromList(matrix, mmatrix)
-
-    # create transformation matrix
-    xform_matrix = OpenMaya.MTransformationMatrix(mmatrix)
-
-    # get translation
-    translation = xform_matrix.getTranslation(OpenMaya.MSpace.kTransform)
-
-    # get rotation
-    # @ref: https://github.com/LumaPictures/pymel/blob/master/pymel/core/datatypes.py
-    # The apicls getRotation needs a "RotationOrder &" object, which is impossible to make in python...
-    euler_rotation = xform_matrix.eulerRotation()
-    euler_rotation.reorderIt(EULER_ROTATION_ORDER[rotation_order])
-    rotation = euler_rotation.asVector()
-
-    return (
-        (translation.x, translation.y, translation.z),
-        (rotation.x * 180.0 / math.pi, rotation.y * 180.0 / math.pi, rotation.z * 180.0 / math.pi)
-    )
+    >>> decompose_matrices([[1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]])
+    [((0.0, 0.0, 0.0), (90.0, 0.0, 0.0))]
+    """
+    euler_order = EULER_ROTATION_ORDER[rotation_order]
+    results = []
+    for matrix in matrices:
+        # create transformation matrix
+        xform_matrix = om.MTransformationMatrix(om.MMatrix(matrix))
+        # get translation
+        translation = xform_matrix.translation(om.MSpace.kTransform)
+        # get rotation in the requested order
+        euler_rotation = xform_matrix.rotation(asQuaternion=False)
+        euler_rotation.reorderIt(euler_order)
+        results.append((
+            (translation.x, translation.y, translation.z),
+            (math.degrees(euler_rotation.x), math.degrees(euler_rotation.y), math.degrees(euler_rotation.z))
+        ))
+    return results
 
 
 def euler_to_quaternion(rotation, rotation_order='xyz'):
@@ -86,12 +123,14 @@ def euler_to_quaternion(rotation, rotation_order='xyz'):
     >>> euler_to_quaternion((90, 0, 0))
     (0.7071, 0.0, 0.0, 0.70710))
     """
-    euler_rotation = OpenMaya.MEulerRotation(
-        rotation[0] * math.pi / 180.0,
-        rotation[1] * math.pi / 180.0,
-        rotation[2] * math.pi / 180.0
+    euler_rotation = om.MEulerRotation(
+        math.radians(rotation[0]),
+        math.radians(rotation[1]),
+        math.radians(rotation[2])
     )
-    euler_rotation.reorderIt(EULER_ROTATION_ORDER[rotation_order])
+    # The rotation is already xyz, only reorder for other orders
+    if rotation_order != 'xyz':
+        euler_rotation.reorderIt(EULER_ROTATION_ORDER[rotation_order])
 
     quat = euler_rotation.asQuaternion()
     return quat.x, quat.y, quat.z, quat.w
@@ -104,11 +143,30 @@ def quaternion_to_euler(rotation, rotation_order='xyz'):
     quaternion_to_euler((0.7071, 0.0, 0.0, 0.70710))
     (90, 0, 0)
     """
-    quat = OpenMaya.MQuaternion(*rotation)
-    euler_rotation = quat.asEulerRotation()
-    euler_rotation.reorderIt(EULER_ROTATION_ORDER[rotation_order])
+    euler_rotation = om.MQuaternion(*rotation).asEulerRotation()
+    # asEulerRotation returns an xyz rotation, only reorder for other orders
+    if rotation_order != 'xyz':
+        euler_rotation.reorderIt(EULER_ROTATION_ORDER[rotation_order])
 
-    return euler_rotation.x * 180.0 / math.pi, euler_rotation.y * 180.0 / math.pi, euler_rotation.z * 180.0 / math.pi
+    return math.degrees(euler_rotation.x), math.degrees(euler_rotation.y), math.degrees(euler_rotation.z)
+
+
+def get_world_translations(transforms):
+    """
+    Get the world space translation for each of the specified transforms in a single API pass
+    :param transforms :type list: list of transform names
+    :return :type list: list of [x, y, z] world space translations, in the same order as the transforms specified
+    """
+    selection_list = om.MSelectionList()
+    for transform in transforms:
+        selection_list.add(transform)
+
+    translations = []
+    for index in range(selection_list.length()):
+        transform_fn = om.MFnTransform(selection_list.getDagPath(index))
+        translation = transform_fn.translation(om.MSpace.kWorld)
+        translations.append([translation.x, translation.y, translation.z])
+    return translations
 
 
 def is_connected_to_array(attribute, array_attr):
@@ -119,32 +177,47 @@ def is_connected_to_array(attribute, array_attr):
     :return :type int or None: int of index in the array or None
     """
     try:
-        indices = cmds.getAttr(array_attr, multiIndices=True) or []
-    except ValueError:
+        array_plug = om.MSelectionList().add(array_attr).getPlug(0)
+        plug = om.MSelectionList().add(attribute).getPlug(0)
+    except RuntimeError:
+        # One of the attributes doesn't exist, so they can't be connected
         return None
-    for i in indices:
-        attr = '{from_attr}[{index}]'.format(from_attr=array_attr, index=i)
-        if attribute in (cmds.listConnections(attr, plugs=True) or []):
-            return i
+    # Walk the elements through the API and compare plugs directly rather than by name
+    for i in range(array_plug.numElements()):
+        element = array_plug.elementByPhysicalIndex(i)
+        if plug in element.connectedTo(True, True):
+            return element.logicalIndex()
     return None
 
 
+def get_array_indices(attr_name):
+    """
+    Get the existing logical indices of an array attribute with a single API call
+    :param attr_name :type str: array attribute i.e node.weights
+    :return :type list: list of ints
+    """
+    plug = om.MSelectionList().add(attr_name).getPlug(0)
+    return list(plug.getExistingArrayAttributeIndices())
+
+
 def get_next_available_index_in_array(attribute):
-    # Get the next available index
-    indices = cmds.getAttr(attribute, multiIndices=True) or []
-    i = 0
-    for index in indices:
-        if index != i and i not in indices:
-            indices.append(i)
-        i += 1
-    indices.sort()
-    attrs = ['{from_attr}[{index}]'.format(from_attr=attribute, index=i) for i in indices]
-    connections = [cmds.listConnections(attr, plugs=True) or [] for attr in attrs]
-    target_index = len(indices)
-    for index, conn in enumerate(connections):
-        if not conn:
-            target_index = index
-            break
+    """
+    Get the lowest index in the array that has no connections, walking the existing elements once through the API
+    :param attribute :type str: array attribute i.e node.meshes
+    :return :type int: next available index
+    """
+    selection = om.MSelectionList()
+    selection.add(attribute)
+    plug = selection.getPlug(0)
+    # Missing indices and existing elements without connections are both free to use
+    connected_indices = set()
+    for i in range(plug.numElements()):
+        element = plug.elementByPhysicalIndex(i)
+        if element.isConnected:
+            connected_indices.add(element.logicalIndex())
+    target_index = 0
+    while target_index in connected_indices:
+        target_index += 1
     return target_index
 
 
@@ -156,14 +229,21 @@ def message_connect(from_attribute, to_attribute, in_array=False, out_array=Fals
     from_object, from_attribute_name = from_attribute.split('.', 1)
     to_object, to_attribute_name = to_attribute.split('.', 1)
 
+    # Resolve both nodes once and query the attributes through the API rather than per-attribute cmds calls
+    from_node = om.MFnDependencyNode(om.MSelectionList().add(from_object).getDependNode(0))
+    to_node = om.MFnDependencyNode(om.MSelectionList().add(to_object).getDependNode(0))
+
     # If the attributes don't exist, create them
-    if not cmds.attributeQuery(from_attribute_name, node=from_object, exists=True):
+    if not from_node.hasAttribute(from_attribute_name):
         cmds.addAttr(from_object, longName=from_attribute_name, attributeType='message', multi=in_array)
-    if not cmds.attributeQuery(to_attribute_name, node=to_object, exists=True):
+    if not to_node.hasAttribute(to_attribute_name):
         cmds.addAttr(to_object, longName=to_attribute_name, attributeType='message', multi=out_array)
     # Check that both attributes, if existing are message attributes
-    for a in (from_attribute, to_attribute):
-        if cmds.getAttr(a, type=1) != 'message':
+    for a, node, attribute_name in (
+            (from_attribute, from_node, from_attribute_name),
+            (to_attribute, to_node, to_attribute_name)
+    ):
+        if not node.attribute(attribute_name).hasFn(om.MFn.kMessageAttribute):
             raise exceptions.MessageConnectionError(
                 'Message Connect: Attribute {attr} is not a message attribute. CONNECTION ABORTED.'.format(
                     attr=a
@@ -218,24 +298,29 @@ def get_attr_array(attr_name, as_value=True):
     :param as_value :type bool: return as value or connected plug name
     :return :type list or any: either returns a list of connections or the value of the attribute
     """
-    # Get the number of indices in the array
-    indices = cmds.getAttr(attr_name, multiIndices=True) or []
-    # Empty list to store the connected plugs
-    connected_plugs = []
-    # Empty list to store values
-    values = []
-    # Iterate through the indices
-    for i in indices:
-        # Get all the connected plugs for this index
-        connections = cmds.listConnections('{attr_name}[{index}]'.format(attr_name=attr_name, index=i), plugs=True)
-        # If we want the plugs and not values, store connections
-        if connections and not as_value:
-            connected_plugs.extend(connections)
-        # If we want values, get the value at the index
-        elif as_value:
-            values.append(cmds.getAttr('{attr_name}[{index}]'.format(attr_name=attr_name, index=i)))
-    # Return plugs or values, depending on which one has data
-    return connected_plugs or values
+    if not as_value:
+        # A single query on the array returns the connections of every element
+        return cmds.listConnections(attr_name, plugs=True) or []
+    # Get the existing indices in the array
+    indices = get_array_indices(attr_name)
+    # Get the value at each index
+    return [cmds.getAttr('{attr_name}[{index}]'.format(attr_name=attr_name, index=i)) for i in indices]
+
+
+def get_matrix_array(attr_name):
+    """
+    Get the values of every element in a matrix array attr in a single pass through the API
+    :param attr_name :type str: attribute name i.e node.poses
+    :return :type list: list of matrices, each a list of 16 floats
+    """
+    selection = om.MSelectionList()
+    selection.add(attr_name)
+    plug = selection.getPlug(0)
+    # Read each element's matrix data directly instead of a getAttr per index
+    return [
+        list(om.MFnMatrixData(plug.elementByPhysicalIndex(i).asMObject()).matrix())
+        for i in range(plug.evaluateNumElements())
+    ]
 
 
 def set_attr_or_connect(source_attr_name, value=None, attr_type=None, output=False):
@@ -281,20 +366,26 @@ def disconnect_attr(attr_name, array=False):
     """
     Disconnect the specified attribute
     :param attr_name :type str: attribute name to disconnect
-    :param array :type bool: is this attribute an array?
+    :param array :type bool: is this attribute an array? Kept for compatibility, listing the connections of an array
+    attribute already includes every element
     """
-    attrs = []
-    # If we are disconnecting an array, get the names of all the attributes
-    if array:
-        attrs.extend(cmds.getAttr(attr_name, multiIndices=True) or [])
-    # Otherwise append the attr name specified
-    else:
-        attrs.append(attr_name)
-    # Iterate through all the attrs listed
-    for attr in attrs:
-        # Find their connections and disconnect them
-        for plug in cmds.listConnections(attr, plugs=True) or []:
-            cmds.disconnectAttr(attr, plug)
+    # Listing the connections on the array itself returns the connections of every element
+    # returns pairs of (attr, destination plug) and (attr, source plug)
+    outgoing = cmds.listConnections(attr_name, plugs=True, connections=True, source=False) or []
+    incoming = cmds.listConnections(attr_name, plugs=True, connections=True, destination=False) or []
+    if not outgoing and not incoming:
+        return
+    # Make all the disconnects as a single undo step without redrawing or re-evaluating for each one
+    cmds.undoInfo(openChunk=True, undoName='disconnect {attr_name}'.format(attr_name=attr_name))
+    try:
+        with suspend_refresh(), suspend_evaluation():
+            for i in range(0, len(outgoing), 2):
+                cmds.disconnectAttr(outgoing[i], outgoing[i + 1])
+            for i in range(0, len(incoming), 2):
+                # flip these because the output is always node centric and not connection centric
+                cmds.disconnectAttr(incoming[i + 1], incoming[i])
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 
 def get_selection(_type=""):
@@ -1,5 +1,7 @@
 # Copyright Epic Games, Inc. All Rights Reserved.
 
+import contextlib
+import logging
 import os
 import webbrowser
 from functools import partial
@@ -13,9 +15,81 @@ from PySide2 import QtUiTools
 from epic_pose_wrangler.v2.view import ui_context
 from epic_pose_wrangler.v2.view.widget import category
 from epic_pose_wrangler.log import LOG
-from epic_pose_wrangler.view import log_widget
+from epic_pose_wrangler.view import icons, log_widget, utils
 from epic_pose_wrangler.model import settings
 
+# Path to the documentation index page
+_DOCUMENTATION_INDEX = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '../..', 'docs', 'site', 'html', 'index.html')
+)
+# Cache of stylesheet path: stylesheet contents
+_STYLESHEET_CACHE = {}
+
+
+@contextlib.contextmanager
+def _batch_update(widgets, block_signals=True):
+    """
+    Context manager to suspend painting, sorting and (optionally) signals on the specified widgets so that they can
+    be repopulated in one pass instead of relaying out for every item added
+    :param widgets :type list: list of QtWidgets.QWidget to suspend
+    :param block_signals :type bool: should signals be blocked while the widgets are updated?
+    """
+    # Store the existing states so nested/pre-blocked widgets are restored correctly
+    states = []
+    for widget in widgets:
+        sorting = widget.isSortingEnabled() if isinstance(widget, QtWidgets.QListWidget) else None
+        states.append((widget, widget.updatesEnabled(), widget.signalsBlocked(), sorting))
+        widget.setUpdatesEnabled(False)
+        if block_signals:
+            widget.blockSignals(True)
+        if sorting:
+            widget.setSortingEnabled(False)
+    try:
+        yield
+    finally:
+        # Restore the widgets in reverse order and schedule a single repaint for each
+        for widget, updates, signals_blocked, sorting in reversed(states):
+            if sorting:
+                widget.setSortingEnabled(True)
+            widget.blockSignals(signals_blocked)
+            widget.setUpdatesEnabled(updates)
+            if isinstance(widget, QtWidgets.QAbstractScrollArea):
+                widget.viewport().update()
+            else:
+                widget.update()
+
+
+class _DeferredLogHandler(logging.Handler):
+    """
+    Log handler that creates the log widget and docks it in the window the first time a record is logged
+    """
+
+    def __init__(self, window):
+        """
+        :param window :type QtWidgets.QMainWindow: window to add the log dock to
+        """
+        super(_DeferredLogHandler, self).__init__()
+        self._window = window
+        self._log_widget = None
+
+    @property
+    def log_widget(self):
+        """
+        :return :type log_widget.LogWidget or None: the log widget, None if nothing has been logged yet
+        """
+        return self._log_widget
+
+    def emit(self, record):
+        """
+        Forward the record to the log widget, creating it first if required
+        :param record :type logging.LogRecord: record to display
+        """
+        if self._log_widget is None:
+            # Create a log dock widget and add the dock to the window
+            self._log_widget = log_widget.LogWidget()
+            self._window.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self._log_widget.log_dock)
+        self._log_widget.handle(record)
+
 
 class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
     """
@@ -76,7 +150,7 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
 
         # Embed the UI window inside this window
         self.setCentralWidget(self.win)
-        self.setWindowIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:unreal.png")))
+        self.setWindowIcon(icons.get_icon("PoseWrangler:unreal.png"))
 
         # Solver Connections
         self.win.create_solver_BTN.pressed.connect(self._create_solver)
@@ -92,20 +166,10 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         self.win.add_driver_BTN.pressed.connect(self._add_drivers)
         self.win.remove_driver_BTN.pressed.connect(self._remove_drivers)
         self.win.import_drivers_ACT.triggered.connect(self._import_drivers)
-        self.win.export_drivers_ACT.triggered.connect(partial(self._export_drivers, True))
+        self.win.export_drivers_ACT.triggered.connect(self._export_all_drivers)
         self.win.export_selected_drivers_ACT.triggered.connect(self._export_drivers)
-        self.win.driver_transforms_LIST.itemDoubleClicked.connect(
-            partial(
-                self._select_in_scene,
-                self.win.driver_transforms_LIST
-            )
-        )
-        self.win.driven_transforms_LIST.itemDoubleClicked.connect(
-            partial(
-                self._select_in_scene,
-                self.win.driven_transforms_LIST
-            )
-        )
+        self.win.driver_transforms_LIST.itemDoubleClicked.connect(self._select_driver_in_scene)
+        self.win.driven_transforms_LIST.itemDoubleClicked.connect(self._select_driven_in_scene)
 
         # Driven Connections
         self.win.add_driven_BTN.pressed.connect(self._add_driven)
@@ -132,31 +196,61 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
 
         self.win.use_maya_style_ACT.setChecked(bool(int(settings.SettingsManager.get_setting("UseMayaStyle") or 0)))
 
-        # Create a log dock widget
-        self._log_widget = log_widget.LogWidget()
-        # Add the log widget as a handler for the current log to display log messages in the UI
-        LOG.addHandler(self._log_widget)
-        # Add the dock to the window
-        self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self._log_widget.log_dock)
+        # Add a handler for the current log to display log messages in the UI. The log dock widget is only created
+        # the first time a message is logged
+        self._log_handler = _DeferredLogHandler(self)
+        LOG.addHandler(self._log_handler)
 
         # Set the stylesheet
         self._set_stylesheet()
         # Empty vars to store the currently edited solver and blendshape, None if not editing either
+        # Dict of driven list item: item data. Mirrors the UserRole data on the items so it can be read without
+        # converting it back from Qt
+        self._driven_item_data = {}
+        # Names of the poses in the pose list, in row order. Lets the selected pose names be looked up from the
+        # selected rows without fetching each item
+        self._pose_names = []
+        # Solver context menu from the last request and the action types it was built from
+        self._context_menu = None
+        self._context_menu_key = None
+        # The edit status of each item is whether it is the item stored here, rather than being duplicated in the
+        # item data
         self._editing_solver = None
         self._editing_blendshape = None
         self._valid_actions = []
+        # Dict of solver name: solver list item. Keyed by name to match RBFNode equality so that any instance of a
+        # solver can be used to look up its item
+        self._solver_items = {}
+        # Dict of list widget: (populate function, set of previously selected names) for lists that were hidden when the
+        # solver settings were loaded. They are populated when they are next shown
+        self._pending_lists = {}
+        # Most recent (solver, drivers, driven_transforms, poses) passed to load_solver_settings that hasn't been
+        # displayed yet. A zero length single shot timer displays it on the next event loop tick
+        self._pending_settings = None
+        self._reload_timer = QtCore.QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self._do_load_solver_settings)
+        # Single shot timer to debounce pose selection changes so that only the final selection of a drag or
+        # select all moves the rig to the pose
+        self._pose_selection_timer = QtCore.QTimer(self)
+        self._pose_selection_timer.setSingleShot(True)
+        self._pose_selection_timer.setInterval(75)
+        self._pose_selection_timer.timeout.connect(self._go_to_selected_pose)
+        for list_ref in (self.win.driver_transforms_LIST, self.win.driven_transforms_LIST, self.win.pose_LIST):
+            list_ref.installEventFilter(self)
 
         # Generate lists of UI elements for different UI states.
         # Solver context enables/disables the specified widgets when a solver is in edit mode or not
-        self._solver_context_ui_elements = [self.win.add_pose_BTN, self.win.delete_pose_BTN,
+        self._solver_context_ui_elements = (self.win.add_pose_BTN, self.win.delete_pose_BTN,
                                             self.win.edit_pose_BTN, self.win.mirror_pose_BTN, self.win.mute_pose_BTN,
                                             self.win.add_driven_BTN, self.win.remove_driven_BTN,
                                             self.win.create_blendshape_BTN,
                                             self.win.add_existing_blendshape_BTN, self.win.edit_blendshape_BTN,
                                             self.win.add_driver_BTN, self.win.remove_driver_BTN,
-                                            self.win.rename_pose_BTN]
+                                            self.win.rename_pose_BTN)
         # Blendshape editing context enables/disables the specified widgets when a blendshape is being edited or not
-        self._blendshape_editing_context_ui_elements = [self.win.add_pose_BTN, self.win.delete_pose_BTN,
+        self._blendshape_editing_context_ui_elements = (self.win.add_pose_BTN, self.win.delete_pose_BTN,
                                                         self.win.edit_pose_BTN, self.win.mirror_pose_BTN,
                                                         self.win.mute_pose_BTN,
                                                         self.win.add_driven_BTN, self.win.remove_driven_BTN,
@@ -164,11 +258,18 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
                                                         self.win.add_existing_blendshape_BTN,
                                                         self.win.add_driver_BTN, self.win.remove_driver_BTN,
                                                         self.win.create_solver_BTN, self.win.delete_solver_BTN,
-                                                        self.win.toggle_edit_BTN, self.win.rename_pose_BTN]
+                                                        self.win.toggle_edit_BTN, self.win.rename_pose_BTN)
+        # Pre-bind the setEnabled methods for each context so toggling them doesn't look the method up every time
+        self._solver_context_enable_fns = tuple(
+            element.setEnabled for element in self._solver_context_ui_elements
+        )
+        self._blendshape_editing_context_enable_fns = tuple(
+            element.setEnabled for element in self._blendshape_editing_context_ui_elements
+        )
 
         # Disable all the solver elements by default
-        for element in self._solver_context_ui_elements:
-            element.setEnabled(False)
+        for set_enabled in self._solver_context_enable_fns:
+            set_enabled(False)
 
         self.show(dockable=True)
 
@@ -185,62 +286,75 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         # Create a new widget item with the solver name
         item = QtWidgets.QListWidgetItem(str(solver))
         # Add the solver and the edit status as custom data on the item
-        item.setData(QtCore.Qt.UserRole, {"solver": solver, "edit": edit})
+        item.setData(QtCore.Qt.UserRole, {"solver": solver})
         # If we are editing, keep track of it
         if edit:
-            self._editing_solver = solver
+            self._editing_solver = item
         # Add the item to the solver list
         self.win.solver_LIST.addItem(item)
+        # Store the item so it can be looked up from the solver later
+        self._solver_items[str(solver)] = item
 
     def clear(self):
         """
         Clear all the lists in the UI
         """
-        self.win.solver_LIST.clear()
-        self.win.driver_transforms_LIST.clear()
-        self.win.driven_transforms_LIST.clear()
-        self.win.pose_LIST.clear()
+        # Drop any data waiting to be displayed
+        self._reload_timer.stop()
+        self._pending_settings = None
+        self._pending_lists.clear()
+        self._solver_items.clear()
+        self._driven_item_data.clear()
+        self._pose_names = []
+        # The solver items are about to be deleted
+        self._editing_solver = None
+        for list_ref in (self.win.solver_LIST, self.win.driver_transforms_LIST, self.win.driven_transforms_LIST,
+                         self.win.pose_LIST):
+            # Skip lists that are already empty to avoid a pointless model reset
+            if not list_ref.count():
+                continue
+            # Block signals so that clearing the solver list doesn't trigger a selection change, all the lists are
+            # being cleared anyway
+            with utils.signals_blocked(list_ref):
+                list_ref.clear()
 
     def delete_solver(self, solver):
         """
         Delete the specified solver from the view
         :param solver :type api.RBFNode: solver ref
         """
-        # Iterate through the solvers
-        for i in range(self.win.solver_LIST.count()):
-            # Get the item
-            item = self.win.solver_LIST.item(i)
-            # If the solver matches the solver from the item data
-            if item.data(QtCore.Qt.UserRole)['solver'] == solver:
-                # Remove the item from the list and break early
-                self.win.solver_LIST.takeItem(self.win.solver_LIST.row(item))
-                break
+        # Find the item for the solver
+        item = self._solver_items.pop(str(solver), None)
+        # If we have an item, remove it from the list
+        if item is not None:
+            self.win.solver_LIST.takeItem(self.win.solver_LIST.row(item))
 
     def display_extensions(self, extensions):
         """
         Adds any found extensions to the utilities dock
         :param extensions :type list: list of PoseWranglerExtension instances
         """
-        # Clear the existing extension layout
-        for i in reversed(range(0, self.win.extension_layout.count())):
-            item = self.win.extension_layout.itemAt(i)
-            if isinstance(item, QtWidgets.QWidgetItem):
+        # Suspend painting on the dock so that the layout is only recalculated once all the extensions are added
+        with _batch_update([self.win.utilities_DOCK], block_signals=False):
+            # Clear the existing extension layout, taking items from the end so nothing is shifted
+            while self.win.extension_layout.count():
+                item = self.win.extension_layout.takeAt(self.win.extension_layout.count() - 1)
+                # Spacers and sub layouts don't have a widget
                 widget = item.widget()
-                widget.deleteLater()
-                del widget
-            self.win.extension_layout.removeItem(item)
-
-        categories = {}
-        for extension in extensions:
-            if extension.view:
-                category_name = extension.__category__ or "Default"
-                if category_name in categories:
-                    category_widget = categories[category_name]
-                else:
-                    category_widget = category.CategoryWidget(category_name)
-                    categories[category_name] = category_widget
-                    self.win.extension_layout.addWidget(category_widget)
-                category_widget.add_extension(extension.view)
+                if widget is not None:
+                    widget.setParent(None)
+                    widget.deleteLater()
+
+            categories = {}
+            for extension in extensions:
+                if extension.view:
+                    category_name = extension.__category__ or "Default"
+                    # Find the existing category widget, creating it if this is the first extension in the category
+                    category_widget = categories.get(category_name)
+                    if category_widget is None:
+                        category_widget = categories[category_name] = category.CategoryWidget(category_name)
+                        self.win.extension_layout.addWidget(category_widget)
+                    category_widget.add_extension(extension.view)
 
         self.win.utilities_DOCK.setMinimumWidth(
             self.win.extension_layout.sizeHint().width() +
@@ -253,12 +367,13 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         :param pose_name :type str: name of the pose to edit or finish editing
         :param edit :type bool: True = edit mode, False = finish editing
         """
-        # Iterate through all of the driven transforms in the list
-        for i in range(self.win.driven_transforms_LIST.count()):
-            # Get the item
-            item = self.win.driven_transforms_LIST.item(i)
-            # Find the custom data stored on the item
-            item_data = item.data(QtCore.Qt.UserRole)
+        # Make sure the driven list is populated before searching it
+        self._flush_pending_list(self.win.driven_transforms_LIST)
+        driven_list = self.win.driven_transforms_LIST
+        # Iterate through all of the driven transforms in row order and look up their data
+        for row in range(driven_list.count()):
+            item = driven_list.item(row)
+            item_data = self._get_driven_item_data(item)
             # If the item type is a blendshape and the pose matches the current pose, break
             if item_data['type'] == 'blendshape' and item_data['pose_name'] == pose_name:
                 break
@@ -270,23 +385,23 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             # If we are already editing a blendshape, finish editing the previous one first
             if self._editing_blendshape is not None:
                 # Get the existing item data from the currently edited blendshape
-                existing_item_data = self._editing_blendshape.data(QtCore.Qt.UserRole)
+                existing_item_data = self._get_driven_item_data(self._editing_blendshape)
                 # Finish editing
                 self.event_edit_blendshape.emit(
                     existing_item_data['pose_name'], False,
                     existing_item_data['solver']
                 )
                 # Update the icon
-                self._editing_blendshape.setIcon(QtGui.QIcon(":/blendShape.png"))
+                self._editing_blendshape.setIcon(icons.get_icon(":/blendShape.png"))
             # Store a ref to the new blendshape being edited
             self._editing_blendshape = item
             # Update the button text
             self.win.edit_blendshape_BTN.setText("Finish Editing Blendshape")
             # Update the icon to show edit mode
-            item.setIcon(QtGui.QIcon(":/fileTextureEdit.png"))
+            item.setIcon(icons.get_icon(":/fileTextureEdit.png"))
             # Disable all the non blendshape related ui elements
-            for element in self._blendshape_editing_context_ui_elements:
-                element.setEnabled(False)
+            for set_enabled in self._blendshape_editing_context_enable_fns:
+                set_enabled(False)
         # If we are not editing
         else:
             # Clear the ref to the edited blendshape
@@ -294,14 +409,10 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             # Revert the button text
             self.win.edit_blendshape_BTN.setText("Edit Blendshape")
             # Revert the icon
-            item.setIcon(QtGui.QIcon(":/blendShape.png"))
+            item.setIcon(icons.get_icon(":/blendShape.png"))
             # Re-enable all the ui elements
-            for element in self._blendshape_editing_context_ui_elements:
-                element.setEnabled(True)
-        # Store the edit status in the item data
-        item_data['edit'] = edit
-        # Update the item data on the widget
-        item.setData(QtCore.Qt.UserRole, item_data)
+            for set_enabled in self._blendshape_editing_context_enable_fns:
+                set_enabled(True)
 
     def edit_solver(self, solver, edit=False):
         """
@@ -309,170 +420,77 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         :param solver :type str: name of the solver to edit or finish editing
         :param edit :type bool: True = edit mode, False = finish editing
         """
-        # Iterate through the solvers
-        for i in range(self.win.solver_LIST.count()):
-            # Get the widget item
-            item = self.win.solver_LIST.item(i)
-            # If the solver matches the item data, break
-            if item.data(QtCore.Qt.UserRole)['solver'] == solver:
-                break
+        # Get the widget item
+        item = self._get_item_from_solver(solver)
         # No match found, return early
-        else:
+        if item is None:
             return
-        # Grab the item data for the item
-        item_data = item.data(QtCore.Qt.UserRole)
 
         # If edit mode
         if edit:
             # If we are already editing a solver, finish editing that one first
             if self._editing_solver is not None:
                 # Update the icon
-                self._editing_solver.setIcon(QtGui.QIcon())
+                self._editing_solver.setIcon(icons.get_icon())
                 # Finish editing
-                self.event_edit_solver.emit(False, self._editing_solver)
+                self.event_edit_solver.emit(False, self._editing_solver.data(QtCore.Qt.UserRole)['solver'])
             # Store the new item as the current edited solver
             self._editing_solver = item
             # Update the button text
             self.win.toggle_edit_BTN.setText("Finish Editing '{solver}'".format(solver=solver))
             # Set the edit icon
-            item.setIcon(QtGui.QIcon(":/fileTextureEdit.png"))
+            item.setIcon(icons.get_icon(":/fileTextureEdit.png"))
         else:
             # Clear the current solver
             self._editing_solver = None
             # Revert the button text
             self.win.toggle_edit_BTN.setText("Edit Selected Driver")
             # Clear the edit icon
-            item.setIcon(QtGui.QIcon())
-
-        # Update the item data with the new edit status
-        item_data['edit'] = edit
-        # Set the item data
-        item.setData(QtCore.Qt.UserRole, item_data)
+            item.setIcon(icons.get_icon())
 
         # Update the solver related ui elements with the current edit status
-        for element in self._solver_context_ui_elements:
-            element.setEnabled(edit)
+        for set_enabled in self._solver_context_enable_fns:
+            set_enabled(edit)
 
-        self.win.delete_solver_BTN.setEnabled(not edit)
-        self.win.create_solver_BTN.setEnabled(not edit)
-        self.win.refresh_BTN.setEnabled(not edit)
-        self.win.mirror_solver_BTN.setEnabled(not edit)
+        # Enable/disable the create, refresh, delete and mirror solver buttons via their container
+        self.win.solver_actions_WIDGET.setEnabled(not edit)
         # If a pose is selected, go to it. This will cause transforms to pop if edits weren't saved
         self._pose_selection_changed()
 
     def get_context(self):
         """
-        Gets the current state of the ui
+        Gets the current state of the ui. Each field is only read from the ui when it is first accessed
         :return: PoseWranglerUIContext
         """
         return ui_context.PoseWranglerUIContext(
-            current_solvers=[i.text() for i in self.win.solver_LIST.selectedItems()],
-            current_poses=[i.text() for i in self.win.pose_LIST.selectedItems()],
-            current_drivers=[i.text() for i in self.win.driver_transforms_LIST.selectedItems()],
-            current_driven=[i.text() for i in self.win.driven_transforms_LIST.selectedItems()],
-            solvers=[self.win.solver_LIST.item(i).text() for i in range(0, self.win.solver_LIST.count())],
-            poses=[self.win.pose_LIST.item(i).text() for i in range(0, self.win.pose_LIST.count())],
-            drivers=[self.win.driver_transforms_LIST.item(i).text() for i in
-                     range(0, self.win.driver_transforms_LIST.count())],
-            driven=[self.win.driven_transforms_LIST.item(i).text() for i in
-                    range(0, self.win.driven_transforms_LIST.count())],
+            current_solvers=partial(self._get_item_names, self.win.solver_LIST, True),
+            current_poses=partial(self._get_item_names, self.win.pose_LIST, True),
+            current_drivers=partial(self._get_item_names, self.win.driver_transforms_LIST, True),
+            current_driven=partial(self._get_item_names, self.win.driven_transforms_LIST, True),
+            solvers=partial(self._get_item_names, self.win.solver_LIST),
+            poses=partial(self._get_item_names, self.win.pose_LIST),
+            drivers=partial(self._get_item_names, self.win.driver_transforms_LIST),
+            driven=partial(self._get_item_names, self.win.driven_transforms_LIST)
         )
 
     def load_solver_settings(self, solver, drivers, driven_transforms, poses):
         """
-        Display the settings for the specified solver
+        Display the settings for the specified solver. The lists are rebuilt on the next event loop tick so that
+        several calls in quick succession (i.e. arrowing through the solvers) only rebuild them once
         :param solver :type RBFNode: solver reference
         :param drivers :type dict: dictionary of driver name: driver data
         :param driven_transforms :type dict: dictionary of driven transform type: driven transforms
         :param poses :type dict: dictionary of pose data
         """
-        # Grab the current selection from the driver, driven and pose list
-        current_drivers = [i.text() for i in self.win.driver_transforms_LIST.selectedItems()]
-        current_driven = [i.text() for i in self.win.driven_transforms_LIST.selectedItems()]
-        current_poses = [i.text() for i in self.win.pose_LIST.selectedItems()]
-
-        # Clear the driver, driven and pose lists
-        self.win.driver_transforms_LIST.clear()
-        self.win.driven_transforms_LIST.clear()
-        self.win.pose_LIST.clear()
-
-        # Iterate through each driver
-        for driver_name, driver_data in drivers.items():
-            # Create new item widget
-            item = QtWidgets.QListWidgetItem(driver_name)
-            # Set the icon to a joint
-            item.setIcon(QtGui.QIcon(":/kinJoint.png"))
-            # Add item to the list
-            self.win.driver_transforms_LIST.addItem(item)
-            # Set the item data so it can be referenced later
-            item.setData(QtCore.Qt.UserRole, driver_data)
+        # Store the latest settings, replacing any that haven't been displayed yet
+        self._pending_settings = (solver, drivers, driven_transforms, poses)
+        # (Re)start the timer to display them
+        self._reload_timer.start()
 
-        # Iterate through the driven transforms transform nodes
-        for driven_transform in driven_transforms['transform']:
-            # Create new item widget
-            item = QtWidgets.QListWidgetItem(driven_transform)
-            # Store the solver and item type
-            item.setData(QtCore.Qt.UserRole, {'type': 'transform', 'solver': solver})
-            # Set the icon to a joint
-            item.setIcon(QtGui.QIcon(":/kinJoint.png"))
-            # Add item to the list
-            self.win.driven_transforms_LIST.addItem(item)
-
-        # Iterate through all the driven transforms blendshapes
-        for blendshape_mesh, pose_name in driven_transforms['blendshape'].items():
-            # Create new item widget
-            item = QtWidgets.QListWidgetItem(blendshape_mesh)
-            # Store the solver, pose associated with the blendshape and the item type
-            item.setData(QtCore.Qt.UserRole, {'type': 'blendshape', 'pose_name': pose_name, 'solver': solver})
-            # Set the icon to blendshape
-            item.setIcon(QtGui.QIcon(":/blendShape.png"))
-            # Add item to the list
-            self.win.driven_transforms_LIST.addItem(item)
-
-        # Iterate through the poses
-        for pose, pose_data in poses.items():
-            # Create item and add it to the list
-            item = QtWidgets.QListWidgetItem(pose)
-            self.win.pose_LIST.addItem(item)
-            muted = not pose_data.get('target_enable', True)
-            if muted:
-                font = item.font()
-                font.setStrikeOut(True)
-                item.setFont(font)
-            # Set icon to a pose
-            item.setIcon(QtGui.QIcon(":/p-head.png"))
-
-        # Iterate through the solvers
-        for row in range(self.win.solver_LIST.count()):
-            # Find the item
-            item = self.win.solver_LIST.item(row)
-            # If the current solver matches this item, select it
-            if solver == item.data(QtCore.Qt.UserRole)['solver']:
-                item.setSelected(True)
-                break
-
-        # Create a map between widgets: names of previously selected items
-        existing_selection_to_list_map = {
-            self.win.driver_transforms_LIST: current_drivers,
-            self.win.driven_transforms_LIST: current_driven,
-            self.win.pose_LIST: current_poses
-        }
-        # Iterate through the widgets: target selections
-        for list_ref, current in existing_selection_to_list_map.items():
-            # Block signals so we don't fire any selection changed events
-            list_ref.blockSignals(True)
-            # Iterate through the list widget
-            for i in range(list_ref.count()):
-                # Get the item
-                item = list_ref.item(i)
-                # Check if the text is in the list of currently selected items (case sensitive) and select/deselect
-                # as appropriate
-                if item.text() in current:
-                    item.setSelected(True)
-                else:
-                    item.setSelected(False)
-            # Unblock the signals
-            list_ref.blockSignals(False)
+        # Find the item for the current solver and select it
+        item = self._get_item_from_solver(solver)
+        if item is not None:
+            item.setSelected(True)
 
     def set_mirror_file(self):
         """
@@ -498,6 +516,181 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         # Set the text
         self.win.mirror_mapping_LINE.setText(path)
 
+    def eventFilter(self, watched, event):
+        """
+        Populate any deferred lists when they are shown
+        :param watched :type QtCore.QObject: object the event was sent to
+        :param event :type QtCore.QEvent: event
+        :return :type bool: True if the event was handled
+        """
+        if event.type() == QtCore.QEvent.Show and watched in self._pending_lists:
+            self._flush_pending_list(watched)
+        return super(PoseWranglerWindow, self).eventFilter(watched, event)
+
+    def _do_load_solver_settings(self):
+        """
+        Display the most recent solver settings passed to load_solver_settings. Lists that aren't currently visible
+        are populated the next time they are shown
+        """
+        # Exit early if there is nothing waiting to be displayed
+        if self._pending_settings is None:
+            return
+        solver, drivers, driven_transforms, poses = self._pending_settings
+        self._pending_settings = None
+        # Stop the timer in case we are flushing the settings early
+        self._reload_timer.stop()
+        # Create a map between widgets: function to populate the widget
+        populate_map = {
+            self.win.driver_transforms_LIST: partial(self._populate_driver_list, drivers),
+            self.win.driven_transforms_LIST: partial(self._populate_driven_list, solver, driven_transforms),
+            self.win.pose_LIST: partial(self._populate_pose_list, poses)
+        }
+        for list_ref, populate in populate_map.items():
+            # Grab the current selection so it can be restored once the list is repopulated. If the list is still
+            # waiting to be populated, carry over the selection it was waiting to restore
+            if list_ref in self._pending_lists:
+                current = self._pending_lists[list_ref][1]
+            else:
+                current = set(i.text() for i in list_ref.selectedItems())
+            # Store the populate function and selection
+            self._pending_lists[list_ref] = (populate, current)
+            # Only populate the list now if the user can see it
+            if list_ref.isVisible():
+                self._flush_pending_list(list_ref)
+
+    def _flush_pending_list(self, list_ref):
+        """
+        Populate the specified list if it has data waiting to be displayed
+        :param list_ref :type QtWidgets.QListWidget: list widget to populate
+        """
+        # Display any solver settings still waiting on the timer first
+        self._do_load_solver_settings()
+        # Exit early if the list is already up to date
+        if list_ref not in self._pending_lists:
+            return
+        populate, current = self._pending_lists.pop(list_ref)
+        # Suspend painting and signals on the list so it is repopulated in a single pass. Signals stay blocked while
+        # the selection is restored so we don't fire any selection changed events
+        with _batch_update([list_ref]):
+            list_ref.clear()
+            populate()
+            # Build a single selection from the runs of previously selected items (case sensitive) so the selection
+            # model is only updated once
+            model = list_ref.model()
+            selection = QtCore.QItemSelection()
+            get_item = list_ref.item
+            count = list_ref.count()
+            start = None
+            for row in range(count + 1):
+                selected = row < count and get_item(row).text() in current
+                # Start a new run of selected rows
+                if selected and start is None:
+                    start = row
+                # End of a run, add it to the selection
+                elif not selected and start is not None:
+                    selection.select(model.index(start, 0), model.index(row - 1, 0))
+                    start = None
+            list_ref.selectionModel().select(selection, QtCore.QItemSelectionModel.ClearAndSelect)
+
+    def _get_item_names(self, list_ref, selected=False):
+        """
+        Get the names of the items in the specified list, populating it first if it is waiting to be displayed
+        :param list_ref :type QtWidgets.QListWidget: list widget
+        :param selected :type bool: only return the selected items
+        :return :type list: list of item names
+        """
+        self._flush_pending_list(list_ref)
+        if selected:
+            return [item.text() for item in list_ref.selectedItems()]
+        item = list_ref.item
+        return [item(i).text() for i in range(list_ref.count())]
+
+    def _populate_driver_list(self, drivers):
+        """
+        Add the drivers to the driver list
+        :param drivers :type dict: dictionary of driver name: driver data
+        """
+        # Bind the lookups used in the loop to locals
+        add_item = self.win.driver_transforms_LIST.addItem
+        list_widget_item = QtWidgets.QListWidgetItem
+        user_role = QtCore.Qt.UserRole
+        joint_icon = icons.get_icon(":/kinJoint.png")
+        # Iterate through each driver
+        for driver_name, driver_data in drivers.items():
+            # Create new item widget
+            item = list_widget_item(driver_name)
+            # Set the icon to a joint
+            item.setIcon(joint_icon)
+            # Set the item data so it can be referenced later. Done before the item is added to the list so
+            # that the model doesn't emit a dataChanged for each item
+            item.setData(user_role, driver_data)
+            # Add item to the list
+            add_item(item)
+
+    def _populate_driven_list(self, solver, driven_transforms):
+        """
+        Add the driven transforms and blendshapes to the driven list
+        :param solver :type RBFNode: solver reference
+        :param driven_transforms :type dict: dictionary of driven transform type: driven transforms
+        """
+        # The list has been cleared, so clear the data stored for the old items
+        self._driven_item_data.clear()
+        # Bind the lookups used in the loops to locals
+        add_item = self.win.driven_transforms_LIST.addItem
+        list_widget_item = QtWidgets.QListWidgetItem
+        user_role = QtCore.Qt.UserRole
+        driven_item_data = self._driven_item_data
+        joint_icon = icons.get_icon(":/kinJoint.png")
+        blendshape_icon = icons.get_icon(":/blendShape.png")
+        # Iterate through the driven transforms transform nodes
+        for driven_transform in driven_transforms['transform']:
+            # Create new item widget
+            item = list_widget_item(driven_transform)
+            # Store the solver and item type
+            item_data = driven_item_data[item] = {'type': 'transform', 'solver': solver}
+            item.setData(user_role, item_data)
+            # Set the icon to a joint
+            item.setIcon(joint_icon)
+            # Add item to the list
+            add_item(item)
+
+        # Iterate through all the driven transforms blendshapes
+        for blendshape_mesh, pose_name in driven_transforms['blendshape'].items():
+            # Create new item widget
+            item = list_widget_item(blendshape_mesh)
+            # Store the solver, pose associated with the blendshape and the item type
+            item_data = driven_item_data[item] = {'type': 'blendshape', 'pose_name': pose_name, 'solver': solver}
+            item.setData(user_role, item_data)
+            # Set the icon to blendshape
+            item.setIcon(blendshape_icon)
+            # Add item to the list
+            add_item(item)
+
+    def _populate_pose_list(self, poses):
+        """
+        Add the poses to the pose list
+        :param poses :type dict: dictionary of pose data
+        """
+        # Add all of the poses to the list in one insert
+        pose_names = list(poses.keys())
+        self._pose_names = pose_names
+        self.win.pose_LIST.addItems(pose_names)
+        pose_icon = icons.get_icon(":/p-head.png")
+        get_item = self.win.pose_LIST.item
+        # Strike out font shared by all the muted poses, created from the first muted item
+        strike_out_font = None
+        # Iterate through the new items to set the icon and mark muted poses
+        for row, pose in enumerate(pose_names):
+            item = get_item(row)
+            muted = not poses[pose].get('target_enable', True)
+            if muted:
+                if strike_out_font is None:
+                    strike_out_font = item.font()
+                    strike_out_font.setStrikeOut(True)
+                item.setFont(strike_out_font)
+            # Set icon to a pose
+            item.setIcon(pose_icon)
+
     # ================================================ Solvers ======================================================= #
 
     def _create_solver(self):
@@ -544,12 +737,10 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         if selection:
             # Grab the last item
             item = selection[-1]
-            # Get the item data
-            item_data = item.data(QtCore.Qt.UserRole)
             # Get the solver
-            solver = item_data['solver']
+            solver = item.data(QtCore.Qt.UserRole)['solver']
             # Trigger edit mode enabled/disabled depending on the solvers current edit state
-            self.event_edit_solver.emit(not item_data.get('edit', False), solver)
+            self.event_edit_solver.emit(item is not self._editing_solver, solver)
 
     def _get_item_from_solver(self, solver):
         """
@@ -557,14 +748,8 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         :param solver :type api.RBFNode: solver ref
         :return :type QtWidgets.QListWidgetItem or None: widget
         """
-        # Iterate through the solver list
-        for i in range(self.win.solver_LIST.count()):
-            # Get the item
-            item = self.win.solver_LIST.item(i)
-            # If the solver stored in the item data matches, return it
-            if item.data(QtCore.Qt.UserRole)['solver'] == solver:
-                return item
-        # No match found, returning None
+        # Look up the item stored when the solver was added, None if no match is found
+        return self._solver_items.get(str(solver))
 
     def _get_selected_solvers(self):
         """
@@ -602,18 +787,23 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             # Set the current solver to the solver associated with this widget
             self.event_set_current_solver.emit(item_data['solver'])
             # Get the solvers edit status
-            edit = item_data.get('edit', False)
+            edit = item is self._editing_solver
             # Enable/disable the ui elements accordingly
-            for element in self._solver_context_ui_elements:
-                element.setEnabled(edit)
+            for set_enabled in self._solver_context_enable_fns:
+                set_enabled(edit)
             # If we are in edit mode
             if edit:
                 # Update the button
                 self.win.toggle_edit_BTN.setText("Finish Editing '{solver}'".format(solver=item_data['solver']))
                 # Set the icon
-                item.setIcon(QtGui.QIcon(":/fileTextureEdit.png"))
+                item.setIcon(icons.get_icon(":/fileTextureEdit.png"))
         # No selection, clear all the lists
         else:
+            self._reload_timer.stop()
+            self._pending_settings = None
+            self._pending_lists.clear()
+            self._driven_item_data.clear()
+            self._pose_names = []
             self.win.driver_transforms_LIST.clear()
             self.win.driven_transforms_LIST.clear()
             self.win.pose_LIST.clear()
@@ -647,6 +837,18 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         # edit mode to true
         self.event_add_driven.emit(None, None, True)
 
+    def _get_driven_item_data(self, item):
+        """
+        Get the data stored for a driven list item
+        :param item :type QtWidgets.QListWidgetItem: driven list item
+        :return :type dict: item data
+        """
+        item_data = self._driven_item_data.get(item)
+        # Fall back to the data stored on the item
+        if item_data is None:
+            item_data = item.data(QtCore.Qt.UserRole)
+        return item_data
+
     def _remove_driven(self):
         """
         Remove driven transforms from the specified solver
@@ -657,7 +859,7 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         if not items:
             return
         # Get the solver for the last item (they should all have the same solver)
-        solver = items[-1].data(QtCore.Qt.UserRole)['solver']
+        solver = self._get_driven_item_data(items[-1])['solver']
         # Trigger event to remove specified nodes for the solver
         self.event_remove_driven.emit([i.text() for i in items], solver)
 
@@ -667,29 +869,25 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         Add an existing blendshape to the solver for the current pose
         """
-        # Get current solver
-        solver = self._get_selected_solvers()
-        # Get current pose
-        poses = self._get_selected_poses()
-        if not solver or not poses:
+        # Get current poses and solver
+        poses, solver = self._get_selected_poses_and_solver()
+        if solver is None or not poses:
             LOG.warning("Unable to add blendshape, please select a solver and a pose and try again")
             return
-        self.event_add_blendshape.emit(poses[-1], "", "", solver[-1])
+        self.event_add_blendshape.emit(poses[-1], "", "", solver)
 
     def _create_blendshape(self):
         """
         Create a blendshape for the current solver at the current pose
         """
-        # Get current solver
-        solver = self._get_selected_solvers()
-        # Get current pose
-        poses = self._get_selected_poses()
-        if not solver or not poses:
+        # Get current poses and solver
+        poses, solver = self._get_selected_poses_and_solver()
+        if solver is None or not poses:
             LOG.warning("Unable to create blendshape, please select a solver and a pose and try again")
             return
         # Create a blendshape for the last pose selected, with the current mesh selection, in edit mode enabled and
         # for the last solver selected
-        self.event_create_blendshape.emit(poses[-1], None, True, solver[-1])
+        self.event_create_blendshape.emit(poses[-1], None, True, solver)
 
     def _edit_blendshape(self):
         """
@@ -697,24 +895,28 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         # Get the current blendshape being edited
         blendshape = self._editing_blendshape
+        item_data = None
         # If none is being edited, see if we have a blendshape selected
         if blendshape is None:
-            # Get all the blendshapes selected
-            selection = [sel for sel in self.win.driven_transforms_LIST.selectedItems() if
-                         sel.data(QtCore.Qt.UserRole)['type'] == 'blendshape']
-            # Update the blendshape var
-            if selection:
-                blendshape = selection[-1]
+            # Search the selection backwards for the last selected blendshape, keeping its item data so it doesn't
+            # need fetching again
+            for sel in reversed(self.win.driven_transforms_LIST.selectedItems()):
+                sel_data = self._get_driven_item_data(sel)
+                if sel_data['type'] == 'blendshape':
+                    blendshape = sel
+                    item_data = sel_data
+                    break
         # If we have a blendshape
         if blendshape:
             # Get the item data
-            item_data = blendshape.data(QtCore.Qt.UserRole)
+            if item_data is None:
+                item_data = self._get_driven_item_data(blendshape)
             # Get the associated pose name and solver
             pose_name = item_data['pose_name']
             solver = item_data['solver']
             # Trigger editing the blendshape for the pose name, using the opposite to the current edit status and for
             # the associated solver
-            self.event_edit_blendshape.emit(pose_name, not item_data.get('edit', False), solver)
+            self.event_edit_blendshape.emit(pose_name, blendshape is not self._editing_blendshape, solver)
 
     # ================================================= Poses ======================================================== #
 
@@ -722,11 +924,11 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         Create a new pose
         """
-        # Get the current solver
-        selected_solvers = self._get_selected_solvers()
-
-        # Get the last selection
-        solver = selected_solvers[-1]
+        # Get the last selected solver
+        solver = self._get_selected_poses_and_solver()[1]
+        # Exit early if no solver is selected
+        if solver is None:
+            return
         # Display popup to get pose name
         pose_name, ok = QtWidgets.QInputDialog.getText(self, 'Create Pose', 'Pose Name:')
         # Hack to fix broken styling caused by using a QInputDialog
@@ -741,68 +943,82 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         Delete the selected poses
         """
-        # Get the currently selected poses
-        poses = self._get_selected_poses()
+        # Get the currently selected poses and solver
+        poses, solver = self._get_selected_poses_and_solver()
         # Exit early if nothing is selected
-        if not poses:
+        if not poses or solver is None:
             return
-        # Get the selected solver
-        solver = self._get_selected_solvers()[-1]
         # Block the signals to stop UI event updates
-        self.win.pose_LIST.blockSignals(True)
-        # For each selected pose, delete it
-        for pose_name in poses:
-            self.event_delete_pose.emit(pose_name, solver)
-        self.win.pose_LIST.blockSignals(False)
+        with utils.signals_blocked(self.win.pose_LIST):
+            # For each selected pose, delete it
+            for pose_name in poses:
+                self.event_delete_pose.emit(pose_name, solver)
 
     def _get_selected_poses(self):
         """
         Get the selected poses
         :return :type list: list of selected pose names
         """
-        return [item.text() for item in self.win.pose_LIST.selectedItems()]
+        # Make sure the list is populated before reading the selection
+        self._flush_pending_list(self.win.pose_LIST)
+        pose_names = self._pose_names
+        return [pose_names[index.row()] for index in self.win.pose_LIST.selectionModel().selectedIndexes()]
+
+    def _get_selected_poses_and_solver(self):
+        """
+        Get the selected poses and the last selected solver, querying each list's selection once
+        :return :type tuple: (list of selected pose names, api.RBFNode or None)
+        """
+        solver_items = self.win.solver_LIST.selectedItems()
+        solver = solver_items[-1].data(QtCore.Qt.UserRole)['solver'] if solver_items else None
+        return self._get_selected_poses(), solver
 
     def _mirror_pose(self):
         """
         Mirror the selected poses
         """
-        # Get the pose selection
-        poses = self._get_selected_poses()
+        # Get the pose and solver selection
+        poses, solver = self._get_selected_poses_and_solver()
         # Exit early if nothing is selected
-        if not poses:
+        if not poses or solver is None:
             return
-        # Get the selected solver
-        solver = self._get_selected_solvers()[-1]
-        # For each pose, mirror it. This will create a mirrored solver if it doesn't already exist
-        for pose_name in poses:
-            self.event_mirror_pose.emit(pose_name, solver)
+        # Block the signals to stop UI event updates
+        with utils.signals_blocked(self.win.pose_LIST):
+            # For each pose, mirror it. This will create a mirrored solver if it doesn't already exist
+            for pose_name in poses:
+                self.event_mirror_pose.emit(pose_name, solver)
 
     def _mute_pose(self):
         """
         Toggles the muted status for the poses the selected poses
         """
-        # Get the pose selection
-        poses = self._get_selected_poses()
+        # Get the pose and solver selection
+        poses, solver = self._get_selected_poses_and_solver()
         # Exit early if nothing is selected
-        if not poses:
+        if not poses or solver is None:
             return
-
-        solver = self._get_selected_solvers()[-1]
-        # For each pose, mirror it. This will create a mirrored solver if it doesn't already exist
-        for pose_name in poses:
-            self.event_mute_pose.emit(pose_name, None, solver)
+        # Block the signals to stop UI event updates
+        with utils.signals_blocked(self.win.pose_LIST):
+            # For each pose, toggle its muted status
+            for pose_name in poses:
+                self.event_mute_pose.emit(pose_name, None, solver)
 
     def _pose_selection_changed(self):
         """
-        On pose selection changed, go to the new pose
+        On pose selection changed, go to the new pose once the selection stops changing
         """
-        # Get the current pose selection
-        selected_poses = self._get_selected_poses()
-        if selected_poses:
+        # (Re)start the timer, a selection change before it times out restarts it
+        self._pose_selection_timer.start()
+
+    def _go_to_selected_pose(self):
+        """
+        Go to the last selected pose
+        """
+        # Get the current pose and solver selection
+        selected_poses, solver = self._get_selected_poses_and_solver()
+        if selected_poses and solver is not None:
             # Get the last pose
             selected_pose = selected_poses[-1]
-            # Get the selected solver
-            solver = self._get_selected_solvers()[-1]
             # Go to pose
             self.event_go_to_pose.emit(selected_pose, solver)
 
@@ -810,15 +1026,13 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         Rename the currently selected pose
         """
-        # Get the current pose selection
-        poses = self._get_selected_poses()
+        # Get the current pose and solver selection
+        poses, solver = self._get_selected_poses_and_solver()
         # Exit early if nothing is selected
-        if not poses:
+        if not poses or solver is None:
             return
         # Get the last selected pose name
         pose_name = poses[-1]
-        # Get the current solver
-        solver = self._get_selected_solvers()[-1]
         # Create a popup to get the new pose name
         new_name, ok = QtWidgets.QInputDialog.getText(self, 'Rename Pose', 'New Pose Name:')
         # Hack to fix broken styling caused by using a QInputDialog
@@ -827,31 +1041,29 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         # Exit if no new name is specified
         if not new_name:
             return
-        # Get the existing pose names
-        existing_names = [self.win.pose_LIST.item(i).text().lower() for i in range(self.win.pose_LIST.count())]
-        # If the pose name already exists, log it and exit
-        if new_name.lower() in existing_names:
+        # If the pose name already exists (case insensitive), log it and exit
+        if self.win.pose_LIST.findItems(new_name, QtCore.Qt.MatchFixedString):
             LOG.error("Pose '{pose_name}' already exists".format(pose_name=new_name))
             return
-        # Pose doesn't already exist, rename it
-        self.event_rename_pose.emit(pose_name, new_name, solver)
+        # Pose doesn't already exist, rename it. Block the signals to stop UI event updates
+        with utils.signals_blocked(self.win.pose_LIST):
+            self.event_rename_pose.emit(pose_name, new_name, solver)
 
     def _update_pose(self):
         """
         Update the pose for the given solver
         """
 
-        # Get the current pose selection
-        poses = self._get_selected_poses()
+        # Get the current pose and solver selection
+        poses, solver = self._get_selected_poses_and_solver()
         # Exit early if nothing is selected
-        if not poses:
+        if not poses or solver is None:
             return
         # Get the last selected pose name
         pose_name = poses[-1]
-        # Get the current solver
-        solver = self._get_selected_solvers()[-1]
-        # Update the pose
-        self.event_update_pose.emit(pose_name, solver)
+        # Update the pose. Block the signals to stop UI event updates
+        with utils.signals_blocked(self.win.pose_LIST):
+            self.event_update_pose.emit(pose_name, solver)
 
     # ================================================== IO ========================================================== #
 
@@ -872,35 +1084,39 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         Export drivers to a file
         :param all_drivers :type bool: should all drivers be exported or just the current selection?
         """
-        # Get the export file path
-        file_path = QtWidgets.QFileDialog.getSaveFileName(None, "Pose Wrangler Format", "", "*.json")[0]
-        # If no path is specified, exit early
-        if file_path == "":
-            return
-
         # If all drivers is specified, get all solvers
         if all_drivers:
             target_solvers = []
         else:
-            # Get the currently selected solvers
+            # Get the currently selected solvers. Checked before asking for a file path so the user isn't asked for
+            # one if the export can't go ahead
             target_solvers = self._get_selected_solvers()
             # If no solvers found, skip export
             if not target_solvers:
                 LOG.warning("Unable to export. No solvers selected")
                 return
 
+        # Get the export file path
+        file_path = QtWidgets.QFileDialog.getSaveFileName(None, "Pose Wrangler Format", "", "*.json")[0]
+        # If no path is specified, exit early
+        if file_path == "":
+            return
+
         # Export drivers
         self.event_export_drivers.emit(file_path, target_solvers)
 
+    def _export_all_drivers(self):
+        """
+        Export all drivers to a file
+        """
+        self._export_drivers(all_drivers=True)
+
     # =============================================== Utilities ====================================================== #
     def _open_documentation(self):
         """
         Open the documentation
         """
-        index_html = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), '../..', 'docs', 'site', 'html', 'index.html')
-        )
-        webbrowser.open(index_html)
+        webbrowser.open(_DOCUMENTATION_INDEX)
 
     def _set_stylesheet(self):
         """
@@ -912,8 +1128,14 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         else:
             styles_path = os.path.join(os.path.dirname(__file__), 'style.qss')
 
-        with open(styles_path) as style:
-            self.setStyleSheet(style.read())
+        # Only read each stylesheet from disk once
+        stylesheet = _STYLESHEET_CACHE.get(styles_path)
+        if stylesheet is None:
+            with open(styles_path) as style:
+                stylesheet = _STYLESHEET_CACHE[styles_path] = style.read()
+        # Setting the stylesheet repolishes every child widget, so skip it if nothing has changed
+        if stylesheet != self.styleSheet():
+            self.setStyleSheet(stylesheet)
 
     def _toggle_stylesheet(self, use_maya_style=False):
         """
@@ -931,7 +1153,7 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         """
         # If no item is provided, select all the items from the list widget specified
         if item is None:
-            items = [list_widget.item(i).text() for i in range(list_widget.count())]
+            items = self._get_item_names(list_widget)
         # Otherwise select the current item
         else:
             items = [item.text()]
@@ -939,14 +1161,40 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
         if items:
             self.event_select.emit(items)
 
+    def _select_driver_in_scene(self, item):
+        """
+        Select the specified driver item in the scene
+        :param item :type QtWidgets.QListWidgetItem: driver item
+        """
+        self._select_in_scene(self.win.driver_transforms_LIST, item)
+
+    def _select_driven_in_scene(self, item):
+        """
+        Select the specified driven item in the scene
+        :param item :type QtWidgets.QListWidgetItem: driven item
+        """
+        self._select_in_scene(self.win.driven_transforms_LIST, item)
+
     def _solver_context_menu_requested(self, point):
         """
         Create a context menu for the solver list widget
         :param point :type QtCore.QPoint: screen position of the request
         """
+        self.event_get_valid_actions.emit(self.get_context())
+        # The controller creates new action instances for each request, so compare the action types to see if the
+        # menu from the previous request can be reused
+        actions_key = tuple(type(action) for action in self._valid_actions)
+        if self._context_menu is not None and actions_key == self._context_menu_key:
+            # Draw the cached menu at the current cursor pos
+            self._context_menu.exec_(QtGui.QCursor.pos())
+            return
+        # Delete the outdated menu
+        if self._context_menu is not None:
+            self._context_menu.deleteLater()
         # Create a new menu
         menu = QtWidgets.QMenu(parent=self)
-        self.event_get_valid_actions.emit(self.get_context())
+        self._context_menu = menu
+        self._context_menu_key = actions_key
 
         # Dict to store sub menu name: sub menu
         sub_menus = {}
@@ -964,11 +1212,19 @@ class PoseWranglerWindow(MayaQWidgetDockableMixin, QtWidgets.QMainWindow):
             # Create a new action on the current menu
             action_widget = current_menu.addAction(action.__display_name__)
             action_widget.setToolTip(action.__tooltip__)
-            # Connect the action trigger to execute the action, passing through the action and data to execute
-            action_widget.triggered.connect(partial(self._trigger_context_menu_action, action))
+            # Store the action on the widget and connect the trigger to execute it. All the actions share the same
+            # slot, which gets the action back from the widget that sent the signal
+            action_widget.setData(action)
+            action_widget.triggered.connect(self._context_menu_action_triggered)
         # Draw the menu at the current cursor pos
         menu.exec_(QtGui.QCursor.pos())
 
+    def _context_menu_action_triggered(self):
+        """
+        Execute the action stored on the context menu action that was triggered
+        """
+        self._trigger_context_menu_action(self.sender().data())
+
     def _trigger_context_menu_action(self, action):
         """
         Execute the specified action with the given data
@@ -1,8 +1,18 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
 class PoseWranglerUIContext(object):
+    # A context is created for every context menu request and action, so avoid a per instance __dict__
+    __slots__ = (
+        '_current_solvers', '_current_poses', '_current_drivers', '_current_driven', '_solvers', '_poses', '_drivers',
+        '_driven'
+    )
+
     def __init__(
             self, current_solvers, current_poses, current_drivers, current_driven, solvers, poses, drivers, driven
     ):
+        """
+        Each field can be given as a value or as a callable that returns the value. Callables are only evaluated the
+        first time the field is accessed
+        """
         self._current_solvers = current_solvers
         self._current_poses = current_poses
         self._current_drivers = current_drivers
@@ -12,34 +22,46 @@ class PoseWranglerUIContext(object):
         self._drivers = drivers
         self._driven = driven
 
+    def _resolve(self, attr):
+        """
+        Get the value of the specified field, evaluating and storing it if it was given as a callable
+        :param attr :type str: name of the attribute storing the field
+        :return: field value
+        """
+        value = getattr(self, attr)
+        if callable(value):
+            value = value()
+            setattr(self, attr, value)
+        return value
+
     @property
     def current_solvers(self):
-        return self._current_solvers
+        return self._resolve('_current_solvers')
 
     @property
     def current_poses(self):
-        return self._current_poses
+        return self._resolve('_current_poses')
 
     @property
     def current_drivers(self):
-        return self._current_drivers
+        return self._resolve('_current_drivers')
 
     @property
     def current_driven(self):
-        return self._current_driven
+        return self._resolve('_current_driven')
 
     @property
     def solvers(self):
-        return self._solvers
+        return self._resolve('_solvers')
 
     @property
     def poses(self):
-        return self._poses
+        return self._resolve('_poses')
 
     @property
     def drivers(self):
-        return self._drivers
+        return self._resolve('_drivers')
 
     @property
     def driven(self):
-        return self._driven
+        return self._resolve('_driven')
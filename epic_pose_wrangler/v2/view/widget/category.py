@@ -1,5 +1,7 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
-from PySide2 import QtCore, QtGui, QtWidgets
+from PySide2 import QtCore, QtWidgets
+
+from epic_pose_wrangler.view import icons
 
 
 class CategoryWidget(QtWidgets.QWidget):
@@ -16,7 +18,7 @@ class CategoryWidget(QtWidgets.QWidget):
         font.setBold(True)
         font.setPointSize(10)
         self._category_button.setFont(font)
-        self._category_button.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:frame_open.png")))
+        self._category_button.setIcon(icons.get_icon("PoseWrangler:frame_open.png"))
         self._category_button.setIconSize(QtCore.QSize(16, 16))
         self._category_button.clicked.connect(self._toggle_category_visibility)
         self._category_button.setCheckable(True)
@@ -35,10 +37,8 @@ class CategoryWidget(QtWidgets.QWidget):
     def _toggle_category_visibility(self):
         self._category_container.setVisible(self._category_button.isChecked())
         self._category_button.setIcon(
-            QtGui.QIcon(QtGui.QPixmap("PoseWrangler:frame_open.png"))
-            if self._category_button.isChecked() else QtGui.QIcon(
-                QtGui.QPixmap("PoseWrangler:frame_closed.png")
-            )
+            icons.get_icon("PoseWrangler:frame_open.png") if self._category_button.isChecked() else
+            icons.get_icon("PoseWrangler:frame_closed.png")
         )
 
     def add_extension(self, widget):
@@ -0,0 +1,20 @@
+#  Copyright Epic Games, Inc. All Rights Reserved.
+from PySide2 import QtGui
+
+# Cache of icon path: QIcon shared by every view so that each icon is only loaded once. QIcons can't be created before
+# the QApplication exists so they are built lazily on first use
+_ICON_CACHE = {}
+
+
+def get_icon(path=""):
+    """
+    Get the cached icon for the specified path, creating it on first use
+    :param path :type str: resource path to the icon, empty string for an empty icon
+    :return :type QtGui.QIcon: icon
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        # Empty path gives an empty icon, used to clear item icons
+        icon = QtGui.QIcon(path) if path else QtGui.QIcon()
+        _ICON_CACHE[path] = icon
+    return icon
@@ -1,15 +1,17 @@
 #  Copyright Epic Games, Inc. All Rights Reserved.
 
+import collections
 import logging
 
 from PySide2 import QtWidgets, QtCore, QtGui
 
+from epic_pose_wrangler.view import icons
+
 
 class LogWidget(logging.Handler):
     """
     Custom Log Handler with embedded QtWidgets.QDockWidget
     """
-
     def __init__(self):
         super(LogWidget, self).__init__()
         # Set default formatting
@@ -30,7 +32,17 @@ class LogWidget(logging.Handler):
         toolbar_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addLayout(toolbar_layout)
 
-        self._output_log = QtWidgets.QListWidget()
+        # Records are stored in a model behind a filter proxy so that showing/hiding log levels is done by Qt
+        # rather than hiding each item
+        self._log_model = QtGui.QStandardItemModel()
+        self._filter_model = QtCore.QSortFilterProxyModel()
+        self._filter_model.setSourceModel(self._log_model)
+        # Filter on the record level stored on each item
+        self._filter_model.setFilterRole(QtCore.Qt.UserRole)
+
+        self._output_log = QtWidgets.QListView()
+        self._output_log.setModel(self._filter_model)
+        self._output_log.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self._output_log.setProperty("Log", True)
         self._output_log.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self._output_log.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -43,7 +55,7 @@ class LogWidget(logging.Handler):
         btn_size = QtCore.QSize(btn_size_px, btn_size_px)
 
         self._debug_btn = QtWidgets.QPushButton()
-        self._debug_btn.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:debug.png")))
+        self._debug_btn.setIcon(icons.get_icon("PoseWrangler:debug.png"))
         self._debug_btn.setIconSize(icon_size)
         self._debug_btn.setProperty("LogButton", True)
         self._debug_btn.setCheckable(True)
@@ -53,7 +65,7 @@ class LogWidget(logging.Handler):
         toolbar_layout.addWidget(self._debug_btn)
 
         self._info_btn = QtWidgets.QPushButton()
-        self._info_btn.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:info.png")))
+        self._info_btn.setIcon(icons.get_icon("PoseWrangler:info.png"))
         self._info_btn.setIconSize(icon_size)
         self._info_btn.setProperty("LogButton", True)
         self._info_btn.setCheckable(True)
@@ -63,7 +75,7 @@ class LogWidget(logging.Handler):
         toolbar_layout.addWidget(self._info_btn)
 
         self._warning_btn = QtWidgets.QPushButton()
-        self._warning_btn.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:warning.png")))
+        self._warning_btn.setIcon(icons.get_icon("PoseWrangler:warning.png"))
         self._warning_btn.setIconSize(icon_size)
         self._warning_btn.setProperty("LogButton", True)
         self._warning_btn.setCheckable(True)
@@ -73,7 +85,7 @@ class LogWidget(logging.Handler):
         toolbar_layout.addWidget(self._warning_btn)
 
         self._error_btn = QtWidgets.QPushButton()
-        self._error_btn.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:error.png")))
+        self._error_btn.setIcon(icons.get_icon("PoseWrangler:error.png"))
         self._error_btn.setIconSize(icon_size)
         self._error_btn.setProperty("LogButton", True)
         self._error_btn.setCheckable(True)
@@ -84,55 +96,101 @@ class LogWidget(logging.Handler):
         toolbar_layout.addStretch(0)
 
         self._clear_log_btn = QtWidgets.QPushButton()
-        self._clear_log_btn.setIcon(QtGui.QIcon(QtGui.QPixmap("PoseWrangler:clear.png")))
+        self._clear_log_btn.setIcon(icons.get_icon("PoseWrangler:clear.png"))
         self._clear_log_btn.setIconSize(icon_size)
         self._clear_log_btn.setProperty("LogButton", True)
         self._clear_log_btn.setFixedSize(btn_size)
-        self._clear_log_btn.clicked.connect(self._output_log.clear)
+        self._clear_log_btn.clicked.connect(self._clear_log)
         toolbar_layout.addWidget(self._clear_log_btn)
 
+        # Map of log level: brush used to display records of that level
+        self._level_brush_map = {
+            logging.DEBUG: QtGui.QBrush(QtGui.QColor(91, 192, 222)),
+            logging.INFO: QtGui.QBrush(QtGui.QColor(247, 247, 247)),
+            logging.WARNING: QtGui.QBrush(QtGui.QColor(240, 173, 78)),
+            logging.ERROR: QtGui.QBrush(QtGui.QColor(217, 83, 79))
+        }
+        # Map of log level: button that toggles the visibility of records of that level
+        self._level_btn_map = {
+            logging.DEBUG: self._debug_btn,
+            logging.INFO: self._info_btn,
+            logging.WARNING: self._warning_btn,
+            logging.ERROR: self._error_btn
+        }
+
+        # Checked state of the level buttons the last time the log was refreshed
+        self._last_filter_state = None
+        # Set up the filter with the initial button states
+        self._refresh_log()
+
+        # Queue of (message, level) waiting to be added to the log. Records are added in batches by a short single
+        # shot timer so that a burst of logging only updates the list once
+        self._pending_records = collections.deque()
+        self._flush_timer = QtCore.QTimer(self._log_dock)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_pending_records)
+
     @property
     def log_dock(self):
         return self._log_dock
 
     def emit(self, record):
-        level_colour_map = {
-            logging.DEBUG: QtGui.QColor(91, 192, 222),
-            logging.INFO: QtGui.QColor(247, 247, 247),
-            logging.WARNING: QtGui.QColor(240, 173, 78),
-            logging.ERROR: QtGui.QColor(217, 83, 79)
-        }
-        msg = self.format(record)
-        item = QtWidgets.QListWidgetItem(msg)
-        item.setData(QtCore.Qt.UserRole, record.levelno)
-        item.setForeground(QtGui.QBrush(level_colour_map[record.levelno]))
-        self._output_log.addItem(item)
-        self._refresh_log()
+        self._pending_records.append((self.format(record), record.levelno))
+        # Start the timer if it isn't already running. It isn't restarted so records are never held back for longer
+        # than a single interval
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending_records(self):
+        """
+        Add all the pending records to the log in one batch
+        """
+        if not self._pending_records:
+            return
+        records = list(self._pending_records)
+        self._pending_records.clear()
+        # Suspend painting so the list is only laid out once for the whole batch
+        self._output_log.setUpdatesEnabled(False)
+        try:
+            append_row = self._log_model.appendRow
+            for msg, levelno in records:
+                item = QtGui.QStandardItem(msg)
+                item.setData(levelno, QtCore.Qt.UserRole)
+                item.setForeground(self._level_brush_map[levelno])
+                # The filter model decides if the new item is visible
+                append_row(item)
+        finally:
+            self._output_log.setUpdatesEnabled(True)
+
+    def _clear_log(self):
+        """
+        Remove all the records from the log
+        """
+        self._log_model.removeRows(0, self._log_model.rowCount())
 
     def _refresh_log(self):
-        level_btn_map = {
-            logging.DEBUG: self._debug_btn,
-            logging.INFO: self._info_btn,
-            logging.WARNING: self._warning_btn,
-            logging.ERROR: self._error_btn
-        }
-        for i in range(0, self._output_log.count()):
-            item = self._output_log.item(i)
-            data = item.data(QtCore.Qt.UserRole)
-            item.setHidden(not level_btn_map[data].isChecked())
+        # The filter only needs updating if the level buttons have changed since the last refresh
+        filter_state = dict((level, btn.isChecked()) for level, btn in self._level_btn_map.items())
+        if filter_state == self._last_filter_state:
+            return
+        self._last_filter_state = filter_state
+        # Build a pattern that matches the enabled levels, i.e. ^(20|30|40)$. If no levels are enabled the pattern
+        # only matches an empty level, which records never have
+        levels = sorted(str(level) for level, checked in filter_state.items() if checked)
+        pattern = "^({levels})$".format(levels="|".join(levels)) if levels else "^$"
+        # Filter the records in one pass
+        self._filter_model.setFilterRegExp(QtCore.QRegExp(pattern))
 
     def _copy_to_clipboard(self):
-        clipboard_text = ""
-        for item in self._output_log.selectedItems():
-            text = item.text()
-            clipboard_text += text
-            if text:
-                clipboard_text += "\n"
+        # Join the non empty lines in one go rather than concatenating them one at a time
+        indexes = sorted(self._output_log.selectionModel().selectedIndexes(), key=lambda index: index.row())
+        clipboard_text = "\n".join(text for text in (index.data() for index in indexes) if text)
         clipboard = QtWidgets.QApplication.clipboard()
         clipboard.setText(clipboard_text)
 
     def _show_context_menu(self, pos):
-        if not self._output_log.selectedItems():
+        if not self._output_log.selectionModel().hasSelection():
             return
         menu = QtWidgets.QMenu(parent=self._output_log)
         copy_action = menu.addAction("Copy")
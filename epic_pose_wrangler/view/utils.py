@@ -0,0 +1,16 @@
+#  Copyright Epic Games, Inc. All Rights Reserved.
+import contextlib
+
+
+@contextlib.contextmanager
+def signals_blocked(widget):
+    """
+    Context manager to block the signals on the specified widget, restoring the previous state even if an exception
+    is raised
+    :param widget :type QtCore.QObject: object to block signals on
+    """
+    previous = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(previous)
@@ -0,0 +1,167 @@
+#  Copyright Epic Games, Inc. All Rights Reserved.
+"""
+Tests for the RBFPoseExporterBatch subprocess export. Maya and the publish tools aren't available outside of Maya, so
+they are replaced with mocks before the export module is loaded straight from its file
+"""
+import os
+import sys
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+_EXPORT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'epic_pose_wrangler', 'v2', 'model', 'export.py'
+)
+_MOCKED_MODULES = [
+    'maya',
+    'maya.cmds',
+    'special_projects',
+    'special_projects.publish_tools',
+    'special_projects.publish_tools.fbx_cmd',
+    'special_projects.publish_tools.utils',
+    'special_projects.rigging',
+    'special_projects.rigging.rbf_node'
+]
+
+
+def _load_export_module():
+    """
+    Load the export module with its Maya dependencies mocked
+    :return :type module: export module
+    """
+    modules = dict((name, mock.MagicMock()) for name in _MOCKED_MODULES)
+    # "from maya import cmds" has to resolve to the same mock as sys.modules['maya.cmds']
+    modules['maya'].cmds = modules['maya.cmds']
+    with mock.patch.dict(sys.modules, modules):
+        try:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location('pose_wrangler_export', _EXPORT_PATH)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except ImportError:
+            import imp
+            module = imp.load_source('pose_wrangler_export', _EXPORT_PATH)
+    return module
+
+
+export = _load_export_module()
+
+
+class _Exporter(object):
+    """
+    Stand in for RBFNodeExporter that only knows its node name
+    """
+
+    def __init__(self, node):
+        self._node = node
+        self.export = mock.MagicMock()
+
+    def node(self):
+        return self._node
+
+
+def _make_batch(nodes):
+    """
+    Build a batch exporter for the specified node names without querying the scene
+    :param nodes :type list: solver node names
+    :return :type export.RBFPoseExporterBatch: batch exporter
+    """
+    batch = export.RBFPoseExporterBatch.__new__(export.RBFPoseExporterBatch)
+    batch._poseExporter = [_Exporter(node) for node in nodes]
+    batch._asset_name = 'asset'
+    batch._export_directory = 'export_directory'
+    batch._rig_scene = 'rig_scene.ma'
+    return batch
+
+
+def _make_process(return_code, output):
+    """
+    Build a mock Popen process
+    :param return_code :type int: process exit code
+    :param output :type bytes: process output
+    :return :type mock.MagicMock: process
+    """
+    process = mock.MagicMock()
+    process.communicate.return_value = (output, None)
+    process.returncode = return_code
+    return process
+
+
+class TestRBFPoseExporterBatch(unittest.TestCase):
+
+    def setUp(self):
+        export.cmds.reset_mock()
+
+    def test_sequential_by_default(self):
+        batch = _make_batch(['solver_a', 'solver_b'])
+        with mock.patch.object(export.subprocess, 'Popen') as popen:
+            batch.export()
+        popen.assert_not_called()
+        for exporter in batch.pose_exporter():
+            exporter.export.assert_called_once_with()
+        self.assertEqual(export.cmds.file.call_count, 2)
+
+    def test_subprocess_per_solver(self):
+        batch = _make_batch(['solver_a', 'solver_b', 'solver_c'])
+        with mock.patch.object(export, '_mayapy_path', return_value='mayapy'), \
+                mock.patch.object(export.subprocess, 'Popen', return_value=_make_process(0, b'')) as popen:
+            batch.export(run_in_subprocess=True)
+
+        self.assertEqual(popen.call_count, 3)
+        scripts = [call[0][0] for call in popen.call_args_list]
+        for node in ['solver_a', 'solver_b', 'solver_c']:
+            self.assertTrue(any(args[0] == 'mayapy' and repr(node) in args[2] for args in scripts))
+        # Nothing is exported in this session
+        for exporter in batch.pose_exporter():
+            exporter.export.assert_not_called()
+
+    def test_subprocess_count_is_capped(self):
+        batch = _make_batch(['solver_a', 'solver_b', 'solver_c', 'solver_d'])
+        with mock.patch.object(export, '_mayapy_path', return_value='mayapy'), \
+                mock.patch.object(export.multiprocessing, 'cpu_count', return_value=8), \
+                mock.patch.object(export, 'ThreadPool', wraps=export.ThreadPool) as thread_pool, \
+                mock.patch.object(export.subprocess, 'Popen', return_value=_make_process(0, b'')):
+            batch.export(run_in_subprocess=True, max_processes=2)
+        thread_pool.assert_called_once_with(processes=2)
+
+    def test_subprocess_failure_is_reported(self):
+        batch = _make_batch(['solver_a', 'solver_b'])
+
+        def popen(args, **kwargs):
+            if repr('solver_b') in args[2]:
+                return _make_process(1, b'export error')
+            return _make_process(0, b'')
+
+        with mock.patch.object(export, '_mayapy_path', return_value='mayapy'), \
+                mock.patch.object(export.subprocess, 'Popen', side_effect=popen):
+            with self.assertRaises(RuntimeError) as context:
+                batch.export(run_in_subprocess=True)
+
+        self.assertIn('solver_b', str(context.exception))
+        self.assertNotIn('solver_a', str(context.exception))
+        # The output is decoded before it is logged
+        export.cmds.warning.assert_called_once()
+        message = export.cmds.warning.call_args[0][0]
+        self.assertIn('export error', message)
+        self.assertNotIn("b'export error'", message)
+
+    def test_missing_mayapy_falls_back_to_sequential(self):
+        batch = _make_batch(['solver_a'])
+        with mock.patch.object(export, '_mayapy_path', return_value=None), \
+                mock.patch.object(export.subprocess, 'Popen') as popen:
+            batch.export(run_in_subprocess=True)
+        popen.assert_not_called()
+        batch.pose_exporter()[0].export.assert_called_once_with()
+
+    def test_empty_batch(self):
+        batch = _make_batch([])
+        with mock.patch.object(export.subprocess, 'Popen') as popen:
+            batch.export(run_in_subprocess=True)
+        popen.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()